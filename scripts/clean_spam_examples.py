@@ -41,7 +41,7 @@ async def clean_spam_examples(*, dry_run: bool = False) -> int:
             "SELECT id, text FROM spam_examples WHERE (confirmed IS NOT DISTINCT FROM true)"
         )
 
-        cleaned = 0
+        updates = []
         for row in rows:
             original_text = row["text"]
             cleaned_text = clean_alert_text(original_text)
@@ -54,16 +54,20 @@ async def clean_spam_examples(*, dry_run: bool = False) -> int:
                         original_text[:80],
                         (cleaned_text or "")[:80],
                     )
-                    cleaned += 1
-                else:
-                    await conn.execute(
-                        "UPDATE spam_examples SET text = $1 WHERE id = $2",
-                        cleaned_text,
-                        row["id"],
-                    )
-                    cleaned += 1
-                    logger.info("Cleaned example %s", row["id"])
-
+                updates.append((cleaned_text, row["id"]))
+
+        if updates and not dry_run:
+            # One pipelined batch in one transaction instead of a round trip
+            # and commit per row; id order keeps lock acquisition consistent
+            updates.sort(key=lambda update: update[1])
+            async with conn.transaction():
+                await conn.executemany(
+                    "UPDATE spam_examples SET text = $1 WHERE id = $2", updates
+                )
+            for _, example_id in updates:
+                logger.info("Cleaned example %s", example_id)
+
+        cleaned = len(updates)
         logger.info(
             "%s %s examples out of %s total",
             "Would clean" if dry_run else "Cleaned",
@@ -68,6 +68,9 @@ def _create_retrying_client(
     return httpx.AsyncClient(timeout=timeout, transport=transport)
 
 
+_gateway_http_client: Optional[httpx.AsyncClient] = None
+
+
 def _create_gateway_model() -> OpenAIChatModel:
     """Create OpenAIChatModel for custom gateway."""
     if not GATEWAY_API_BASE:
@@ -77,7 +80,8 @@ def _create_gateway_model() -> OpenAIChatModel:
     if not GATEWAY_MODEL:
         raise ValueError("CUSTOM_GATEWAY_MODEL environment variable is required")
 
-    client = _create_retrying_client()
+    global _gateway_http_client
+    client = _gateway_http_client = _create_retrying_client()
     openai_client = AsyncOpenAI(
         base_url=f"{GATEWAY_API_BASE.rstrip('/')}",
         api_key=GATEWAY_API_KEY,
@@ -90,12 +94,36 @@ def _create_gateway_model() -> OpenAIChatModel:
     )
 
 
+# One keep-alive pool for every OpenRouter model (spam and chat agents alike)
+_openrouter_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_openrouter_http_client() -> httpx.AsyncClient:
+    global _openrouter_http_client
+    if _openrouter_http_client is None:
+        _openrouter_http_client = _create_retrying_client()
+    return _openrouter_http_client
+
+
+async def close_llm_http_clients() -> None:
+    """Close the gateway and OpenRouter connection pools (server shutdown)."""
+    global _gateway_http_client, _openrouter_http_client
+    clients = [
+        client
+        for client in (_gateway_http_client, _openrouter_http_client)
+        if client is not None
+    ]
+    _gateway_http_client = _openrouter_http_client = None
+    for client in clients:
+        await client.aclose()
+
+
 def _create_openrouter_model(model_name: str) -> OpenAIChatModel:
     """Create OpenAIChatModel for a specific OpenRouter model."""
     if not OPENROUTER_API_KEY:
         raise ValueError("OPENROUTER_API_KEY environment variable is required")
 
-    client = _create_retrying_client()
+    client = _get_openrouter_http_client()
     openai_client = AsyncOpenAI(
         base_url=f"{OPENROUTER_API_BASE.rstrip('/')}",
         api_key=OPENROUTER_API_KEY,
@@ -25,7 +25,7 @@ from ..database import (
     get_admin_group_ids,
     get_admins_for_depletion_timeline,
     get_admins_for_low_balance_warnings,
-    get_paying_admins,
+    get_groups_with_paying_admins,
     mark_depletion_day_1_warned,
     mark_depletion_day_6_warned,
     mark_low_balance_warned,
@@ -150,9 +150,10 @@ async def leave_sole_payer_groups(admin_id: int) -> None:
     bot_info = await bot.me()
     ref_link = f"https://t.me/{bot_info.username}?start={admin_id}"
 
+    paid_group_ids = await get_groups_with_paying_admins(group_ids)
+
     for group_id in group_ids:
-        paying = await get_paying_admins(group_id)
-        if len(paying) == 0:
+        if group_id not in paid_group_ids:
             try:
                 chat = await bot.get_chat(group_id)
                 title = getattr(chat, "title", None) or str(group_id)
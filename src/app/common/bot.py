@@ -13,10 +13,10 @@ bot = Bot(token=bot_token)
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 
 try:
-    import yaml
+    from .utils import load_config
 
-    with open("config.yaml", "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    # Shared cached parse of config.yaml
+    config = load_config()
 
     system = config.get("system", {})
     LESHCHENKO_CHAT_ID = system.get("admin_chat_id", 133526395)
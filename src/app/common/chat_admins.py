@@ -0,0 +1,28 @@
+"""Short-lived cache of Telegram chat administrator lists."""
+
+from typing import List
+
+from aiogram import Bot
+from aiogram.types import ChatMember
+
+from .ttl_cache import TTLCache
+from .utils import load_config
+
+# Admin lists change rarely; the bot's own membership changes invalidate them
+_admins_cache: TTLCache[List[ChatMember]] = TTLCache(
+    ttl=load_config().get("cache", {}).get("chat_admins_ttl_seconds", 60),
+    maxsize=10_000,
+)
+
+
+async def get_chat_administrators_cached(bot: Bot, chat_id: int) -> List[ChatMember]:
+    """bot.get_chat_administrators, reused for a short while per chat."""
+    admins = _admins_cache.get(chat_id)
+    if admins is None:
+        admins = list(await bot.get_chat_administrators(chat_id))
+        _admins_cache.set(chat_id, admins)
+    return admins
+
+
+def invalidate_chat_administrators(chat_id: int) -> None:
+    _admins_cache.pop(chat_id)
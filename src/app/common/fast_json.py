@@ -0,0 +1,29 @@
+"""
+JSON helpers for hot paths (webhook updates, LLM prompt payloads).
+
+Uses orjson when it is installed and falls back to the stdlib otherwise. Both
+produce compact UTF-8 output without ASCII escaping, so prompts are identical
+either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to compact JSON (no spaces, non-ASCII kept as is)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
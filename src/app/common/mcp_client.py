@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional
 import aiohttp
 import logfire
 
+from . import fast_json
 from .utils import retry_on_network_error
 
 logger = logging.getLogger(__name__)
@@ -57,7 +58,9 @@ class McpHttpClient:
             self._connector = aiohttp.TCPConnector(ssl=self._session_ssl_kwargs["ssl"])
         else:
             self._connector = aiohttp.TCPConnector()
-        self._session = aiohttp.ClientSession(connector=self._connector)
+        self._session = aiohttp.ClientSession(
+            connector=self._connector, json_serialize=fast_json.dumps
+        )
         return self._session
 
     async def aclose(self) -> None:
@@ -144,7 +147,7 @@ class McpHttpClient:
                         for line in text.splitlines():
                             if line.startswith("data: "):
                                 try:
-                                    data = json.loads(line[len("data: ") :])
+                                    data = fast_json.loads(line[len("data: ") :])
                                     break
                                 except json.JSONDecodeError:
                                     continue
@@ -153,7 +156,7 @@ class McpHttpClient:
                                 f"MCP HTTP bridge returned text/event-stream but no valid data found: {text}"
                             )
                     else:
-                        data = await response.json()
+                        data = await response.json(loads=fast_json.loads)
                 except (aiohttp.ContentTypeError, json.JSONDecodeError) as e:
                     text = await response.text()
                     span.set_level("error")
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 import aiohttp
 import logfire
 
+from . import fast_json
 from .utils import retry_on_network_error
 
 logger = logging.getLogger(__name__)
@@ -41,6 +42,35 @@ class MtprotoHttpClient:
             ssl_context = ssl.create_default_context(cafile=ca_bundle)
             self._session_ssl_kwargs["ssl"] = ssl_context
 
+        self._connector: aiohttp.BaseConnector | None = None
+        self._session: aiohttp.ClientSession | None = None
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is not None:
+            if not self._session.closed:
+                return self._session
+            await self._session.close()
+            self._session = None
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+        if "ssl" in self._session_ssl_kwargs:
+            self._connector = aiohttp.TCPConnector(ssl=self._session_ssl_kwargs["ssl"])
+        else:
+            self._connector = aiohttp.TCPConnector()
+        self._session = aiohttp.ClientSession(
+            connector=self._connector, json_serialize=fast_json.dumps
+        )
+        return self._session
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
     @classmethod
     def from_env(
         cls,
@@ -140,45 +170,40 @@ class MtprotoHttpClient:
         }
 
         client_timeout = aiohttp.ClientTimeout(total=timeout)
-        connector = None
-        if "ssl" in self._session_ssl_kwargs:
-            connector = aiohttp.TCPConnector(ssl=self._session_ssl_kwargs["ssl"])
-
-        session_kwargs: Dict[str, Any] = {"timeout": client_timeout}
-        if connector:
-            session_kwargs["connector"] = connector
-
-        async with aiohttp.ClientSession(**session_kwargs) as session:
-            with logfire.span(
-                "mtproto_http_call",
-                method=method,
-                url=url,
-                payload=payload,
-            ) as span:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    span.set_attribute("status", response.status)
-                    try:
-                        data = await response.json()
-                    except aiohttp.ContentTypeError as e:
-                        text = await response.text()
-                        span.set_level("error")
-                        span.record_exception(e)
-                        span.set_attribute("response_text", text)
-                        raise MtprotoHttpError(
-                            f"MTProto HTTP bridge returned non-JSON body: {text}"
-                        ) from e
-                    span.set_attribute("response", data)
-
-                    if response.status >= 400:
-                        raise MtprotoHttpError(
-                            f"MTProto HTTP bridge error {response.status}: {data}"
-                        )
-
-                    if data.get("error"):
-                        raise MtprotoHttpError(str(data["error"]))
-
-                    # Bridge responses use `result` for successful payloads.
-                    return data.get("result", data)
+        # Reuse one keep-alive session instead of a TLS handshake per call
+        session = await self._ensure_session()
+        with logfire.span(
+            "mtproto_http_call",
+            method=method,
+            url=url,
+            payload=payload,
+        ) as span:
+            async with session.post(
+                url, headers=headers, json=payload, timeout=client_timeout
+            ) as response:
+                span.set_attribute("status", response.status)
+                try:
+                    data = await response.json(loads=fast_json.loads)
+                except aiohttp.ContentTypeError as e:
+                    text = await response.text()
+                    span.set_level("error")
+                    span.record_exception(e)
+                    span.set_attribute("response_text", text)
+                    raise MtprotoHttpError(
+                        f"MTProto HTTP bridge returned non-JSON body: {text}"
+                    ) from e
+                span.set_attribute("response", data)
+
+                if response.status >= 400:
+                    raise MtprotoHttpError(
+                        f"MTProto HTTP bridge error {response.status}: {data}"
+                    )
+
+                if data.get("error"):
+                    raise MtprotoHttpError(str(data["error"]))
+
+                # Bridge responses use `result` for successful payloads.
+                return data.get("result", data)
 
 
 _client: Optional[MtprotoHttpClient] = None
@@ -189,3 +214,10 @@ def get_mtproto_client() -> MtprotoHttpClient:
     if _client is None:
         _client = MtprotoHttpClient.from_env()
     return _client
+
+
+async def close_mtproto_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
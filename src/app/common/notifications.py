@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import logging
 from collections.abc import Callable
@@ -13,6 +14,9 @@ from .utils import retry_on_network_error
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent private sends per notify_admins_with_fallback_and_cleanup call
+MAX_PARALLEL_ADMIN_NOTIFICATIONS = 10
+
 
 @logfire.no_auto_trace
 @logfire.instrument(extract_args=True, record_return=True)
@@ -59,64 +63,65 @@ async def notify_admins_with_fallback_and_cleanup(
     bots_skipped = []
     last_admin_info = None
 
-    for admin_id in admin_ids:
-        try:
-            # Fast path: if admins are pre-filtered, skip expensive bot detection
-            if assume_human_admins:
-                # Skip bot detection entirely - trust the caller
-                admin_chat = None
-            else:
-                # Get admin chat info with retry (expensive API call)
-                @retry_on_network_error
-                async def get_chat_info():
-                    return await bot.get_chat(admin_id)
-
-                admin_chat = await get_chat_info()
+    # Admins are notified concurrently; the semaphore keeps a large admin list
+    # from bursting past Telegram's per-bot message rate
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_ADMIN_NOTIFICATIONS)
 
-                # Check if this is a bot account
-                is_bot = False
-                if getattr(admin_chat, "type", None) == "private":
-                    # Primary check: API-reported bot status
-                    is_bot = getattr(admin_chat, "is_bot", False)
-
-                    # Additional check: negative IDs indicate channels/bots
-                    if not is_bot and admin_id < 0:
-                        is_bot = True
-                        logfire.warning(
-                            f"Detected channel/bot account {admin_id} with negative ID"
+    async def notify_admin(admin_id: int) -> tuple[str, object | None]:
+        """Returns (outcome, chat info) where outcome is notified/bot/unreachable/skipped."""
+        msg_text = None
+        admin_chat = None
+        try:
+            async with semaphore:
+                # Fast path: if admins are pre-filtered, skip expensive bot detection
+                if not assume_human_admins:
+                    # Get admin chat info with retry (expensive API call)
+                    @retry_on_network_error
+                    async def get_chat_info():
+                        return await bot.get_chat(admin_id)
+
+                    admin_chat = await get_chat_info()
+
+                    # Check if this is a bot account
+                    is_bot = False
+                    if getattr(admin_chat, "type", None) == "private":
+                        # Primary check: API-reported bot status
+                        is_bot = getattr(admin_chat, "is_bot", False)
+
+                        # Additional check: negative IDs indicate channels/bots
+                        if not is_bot and admin_id < 0:
+                            is_bot = True
+                            logfire.warning(
+                                f"Detected channel/bot account {admin_id} with negative ID"
+                            )
+
+                    if is_bot:
+                        logfire.info(
+                            f"Skipping bot admin {admin_id} ({getattr(admin_chat, 'first_name', 'Unknown')}) - cannot send messages to bots"
                         )
+                        return "bot", None
 
-                if is_bot:
-                    logfire.info(
-                        f"Skipping bot admin {admin_id} ({getattr(admin_chat, 'first_name', 'Unknown')}) - cannot send messages to bots"
-                    )
-                    bots_skipped.append(admin_id)
-                    continue
-
-            # Resolve message (support per-admin customization)
-            if callable(private_message):
-                msg_text = cast(Callable[[int], str], private_message)(admin_id)
-            else:
-                msg_text = private_message
+                # Resolve message (support per-admin customization)
+                if callable(private_message):
+                    msg_text = cast(Callable[[int], str], private_message)(admin_id)
+                else:
+                    msg_text = private_message
 
-            # Send message with retry
-            @retry_on_network_error
-            async def send_private_message():
-                return await bot.send_message(
-                    admin_id,
-                    msg_text,
-                    parse_mode=parse_mode,
-                    reply_markup=reply_markup,
-                    disable_web_page_preview=True,
-                )
+                # Send message with retry
+                @retry_on_network_error
+                async def send_private_message():
+                    return await bot.send_message(
+                        admin_id,
+                        msg_text,
+                        parse_mode=parse_mode,
+                        reply_markup=reply_markup,
+                        disable_web_page_preview=True,
+                    )
 
-            await send_private_message()
+                await send_private_message()
 
-            notified_private.append(admin_id)
-            # Use admin_chat if available, otherwise we'll handle fallback without it
-            if admin_chat:
-                last_admin_info = admin_chat
             logger.debug(f"Successfully notified admin {admin_id} in private")
+            return "notified", admin_chat
         except Exception as e:
             # Check if this is a content parsing error vs access/permission error
             if isinstance(e, TelegramBadRequest):
@@ -137,27 +142,40 @@ async def notify_admins_with_fallback_and_cleanup(
                     )
                     # Don't treat content parsing errors as "unreachable admin"
                     # These should be fixed in the message formatting, not trigger fallback
-                    continue
+                    return "skipped", None
                 else:
                     # Other TelegramBadRequest errors (like invalid chat_id) should be treated as unreachable
                     logger.warning(
                         f"Telegram API error when notifying admin {admin_id}: {e}",
                         exc_info=True,
                     )
-                    unreachable.append(admin_id)
             else:
                 logger.info(
                     f"Failed to notify admin {admin_id} in private: {e}", exc_info=True
                 )
-                unreachable.append(admin_id)
+            fallback_chat = None
             with contextlib.suppress(Exception):
 
                 @retry_on_network_error
                 async def get_chat_info_fallback():
                     return await bot.get_chat(admin_id)
 
-                admin_chat = await get_chat_info_fallback()
-                last_admin_info = admin_chat
+                fallback_chat = await get_chat_info_fallback()
+            return "unreachable", fallback_chat
+
+    outcomes = await asyncio.gather(*(notify_admin(admin_id) for admin_id in admin_ids))
+
+    # Collect in admin_ids order so "last accessible admin" means the same as before
+    for admin_id, (outcome, admin_chat) in zip(admin_ids, outcomes):
+        if outcome == "notified":
+            notified_private.append(admin_id)
+        elif outcome == "bot":
+            bots_skipped.append(admin_id)
+        elif outcome == "unreachable":
+            unreachable.append(admin_id)
+        if admin_chat:
+            last_admin_info = admin_chat
+
     result = {
         "notified_private": notified_private,
         "unreachable": unreachable,
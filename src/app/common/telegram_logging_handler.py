@@ -57,6 +57,15 @@ class TelegramLogHandler(logging.Handler):
         if record.name.startswith(__name__):
             return
 
+        # Bypass throttling for ERROR and CRITICAL level messages (keep deduplication)
+        bypass_throttling = record.levelno >= logging.ERROR
+
+        if not bypass_throttling:
+            with self._lock:
+                if self._loop is not None and not self._allow_throughput():
+                    # Dropped below anyway: skip formatting and HTML escaping
+                    return
+
         try:
             text = self._render_message(record)
         except Exception:
@@ -69,9 +78,6 @@ class TelegramLogHandler(logging.Handler):
                 self._message_queue.append(text)
                 return
 
-            # Bypass throttling for ERROR and CRITICAL level messages (keep deduplication)
-            bypass_throttling = record.levelno >= logging.ERROR
-
             if self._should_dedupe(text):
                 return
 
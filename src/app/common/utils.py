@@ -75,11 +75,15 @@ async def send_admin_dm(admin_id: int, text: str, log_context: str = "message")
         return False
 
 
+# libyaml's C loader when PyYAML was built with it; same safe subset either way
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 @cache
 def load_config() -> Dict[str, Any]:
     """Load config from config.yaml."""
     with open("config.yaml", "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAML_LOADER)
     logger.debug("Configuration loaded successfully")
     return config
 
@@ -103,12 +107,26 @@ def spam_notify_spammers_via_mcp_enabled() -> bool:
 
 def remove_lines_to_fit_len(text: str, max_len: int) -> str:
     """Trim text to max_len by collapsing middle lines."""
+    budget = max_len - len("...\n")
     splitted = text.split("\n")
-
-    while len(text) > max_len - len("...\n") and len(splitted) > 2:
-        half = len(splitted) // 2
-        text = "\n".join(splitted[:half] + ["..."] + splitted[half + 1 :])
-        splitted = splitted[:half] + splitted[half + 1 :]
+    n = len(splitted)
+
+    if len(text) > budget and n > 2:
+        # Drop middle lines one at a time, tracking only how many head/tail
+        # lines are kept and their total length, then join once: O(n)
+        lengths = [len(line) for line in splitted]
+        head = n // 2
+        tail = n - head - 1
+        kept = sum(lengths) - lengths[head]
+        # Joined length: kept chars, head + tail newlines and the "..." line
+        while kept + head + tail + 3 > budget and head + tail > 2:
+            if head > tail:
+                head -= 1
+                kept -= lengths[head]
+            else:
+                tail -= 1
+                kept -= lengths[n - tail - 1]
+        text = "\n".join(splitted[:head] + ["..."] + splitted[n - tail :])
 
     if len(text) > max_len:
         text = text[: max_len - len("...")] + "..."
@@ -217,6 +235,91 @@ def sanitize_llm_html(text: str) -> str:
     return text
 
 
+# Telegram rejects messages over 4096 chars; the headroom covers the tags
+# re-opened and closed around each chunk
+TELEGRAM_HTML_CHUNK_LIMIT = 4000
+
+_HTML_TAG_RE = re.compile(r"<(/?)([a-zA-Z-]+)[^>]*>")
+# Tags that never get a closing tag, so they must not be carried across chunks
+_VOID_TAGS = frozenset({"br", "hr", "img", "wbr"})
+_HTML_ENTITY_RE = re.compile(r"&#?\w+;")
+
+
+def _hard_cut_index(text: str, limit: int) -> int:
+    """Cut position at or before ``limit`` that does not split a tag or entity."""
+    cut = limit
+    for opener, pattern in (("<", _HTML_TAG_RE), ("&", _HTML_ENTITY_RE)):
+        start = text.rfind(opener, 0, cut)
+        match = pattern.match(text, start) if start != -1 else None
+        if match is not None and match.end() > cut:
+            # Step back before it, or past it when it opens the text
+            cut = start or match.end()
+    return cut
+
+
+def _split_plain(
+    text: str, limit: int, separators: tuple[str, ...] = ("\n\n", "\n")
+) -> list[str]:
+    """Split on paragraph, then line boundaries; hard-cut only as a last resort."""
+    if len(text) <= limit:
+        return [text]
+    if not separators:
+        pieces = []
+        while len(text) > limit:
+            cut = _hard_cut_index(text, limit)
+            pieces.append(text[:cut])
+            text = text[cut:]
+        return [*pieces, text] if text else pieces
+
+    sep, finer = separators[0], separators[1:]
+    pieces = []
+    current = ""
+    for part in text.split(sep):
+        candidate = f"{current}{sep}{part}" if current else part
+        if len(candidate) <= limit:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        *done, current = _split_plain(part, limit, finer)
+        pieces.extend(done)
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_html_message(text: str, limit: int = TELEGRAM_HTML_CHUNK_LIMIT) -> list[str]:
+    """
+    Split Telegram HTML into messages of at most ``limit`` characters.
+
+    Tags left open at the end of a chunk are closed there and re-opened at the
+    start of the next one, so every chunk parses on its own.
+    """
+    if len(text) <= limit:
+        return [text]
+
+    chunks: list[str] = []
+    open_tags: list[tuple[str, str]] = []  # (name, opening tag as written)
+    for piece in _split_plain(text, limit):
+        prefix = "".join(tag for _, tag in open_tags)
+        for match in _HTML_TAG_RE.finditer(piece):
+            name = match[2].lower()
+            if name in _VOID_TAGS or match[0].endswith("/>"):
+                continue
+            if not match[1]:
+                open_tags.append((name, match[0]))
+            elif open_tags and open_tags[-1][0] == name:
+                open_tags.pop()
+        suffix = "".join(f"</{name}>" for name, _ in reversed(open_tags))
+        chunks.append(prefix + piece + suffix)
+    return chunks
+
+
+def html_to_plain_text(text: str) -> str:
+    """Strip Telegram HTML markup, leaving text that is safe to send unparsed."""
+    return html.unescape(_HTML_TAG_RE.sub("", text))
+
+
 def clean_alert_text(text: str | None) -> str | None:
     """Strip alert/notification wrapper from text if present."""
     if not text:
@@ -0,0 +1,132 @@
+"""
+Write-behind queue for database writes that handlers do not wait on.
+
+Items are buffered in memory and flushed by a single consumer task in batches
+(up to ``max_batch`` items or ``max_delay`` seconds, whichever comes first).
+Items with the same key inside one batch are collapsed: the latest one wins,
+or ``merge(older, newer)`` combines them when given; without a ``key`` every
+item is passed to ``flush`` (e.g. counters it sums up).
+When the consumer is not running (tests, scripts) ``submit`` writes through
+synchronously, so callers behave the same either way.
+"""
+
+import asyncio
+import logging
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_STOP = object()
+
+
+class WriteBehindQueue(Generic[T]):
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[List[T]], Awaitable[None]],
+        *,
+        key: Optional[Callable[[T], Hashable]] = None,
+        merge: Optional[Callable[[T, T], T]] = None,
+        max_batch: int = 100,
+        max_delay: float = 0.2,
+        maxsize: int = 10_000,
+    ) -> None:
+        self._name = name
+        self._flush = flush
+        self._key = key
+        self._merge = merge
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._maxsize = maxsize
+        self._queue: Optional[asyncio.Queue[T]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the consumer task on the running event loop."""
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._task = asyncio.create_task(self._run(), name=f"write_behind:{self._name}")
+
+    async def submit(self, item: T) -> None:
+        """Enqueue an item, or write it through when the consumer is not running."""
+        if not self.is_running or self._queue is None:
+            await self._flush([item])
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning(f"{self._name} write-behind queue full, writing through")
+            await self._flush([item])
+
+    async def stop(self) -> None:
+        """Flush everything still queued and stop the consumer."""
+        task, self._task = self._task, None
+        if self._queue is None:
+            return
+        if task and not task.done():
+            await self._queue.put(_STOP)  # type: ignore[arg-type]
+            await task
+        pending: List[T] = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for start in range(0, len(pending), self._max_batch):
+            await self._flush_batch(pending[start : start + self._max_batch])
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stopping = False
+            deadline = loop.time() + self._max_delay
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush_batch(batch)
+            if stopping:
+                return
+
+    async def _flush_batch(self, batch: List[T]) -> None:
+        if self._key is not None:
+            deduped: Dict[Hashable, T] = {}
+            for item in batch:
+                item_key = self._key(item)
+                if self._merge is not None and item_key in deduped:
+                    item = self._merge(deduped[item_key], item)
+                deduped[item_key] = item
+            batch = list(deduped.values())
+        try:
+            await self._flush(batch)
+        except Exception as e:
+            logger.warning(
+                f"{self._name} write-behind flush of {len(batch)} items failed: {e}",
+                exc_info=True,
+            )
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .constants import INITIAL_CREDITS
 from .models import Administrator, ModerationMode
@@ -105,6 +105,52 @@ async def save_admin(admin: Administrator) -> None:
             )
 
 
+async def upsert_admins(conn, admins: Iterable[Tuple[int, Optional[str]]]) -> None:
+    """
+    Create missing admins and backfill unknown usernames in one batch.
+
+    New rows get the same defaults save_admin writes for a fresh admin;
+    credits, settings and last_active of existing admins are left untouched.
+    """
+    mode = ModerationMode.NOTIFY
+    if await _has_delete_spam_column(conn):
+        await conn.executemany(
+            """
+            INSERT INTO administrators (
+                admin_id, username, credits, moderation_mode, delete_spam,
+                created_at, last_active
+            ) VALUES ($1, $2, $3, $4, $5, NOW(), NOW())
+            ON CONFLICT (admin_id) DO UPDATE SET
+                username = COALESCE(administrators.username, EXCLUDED.username)
+            """,
+            [
+                (
+                    admin_id,
+                    username,
+                    INITIAL_CREDITS,
+                    mode.value,
+                    _legacy_delete_spam(mode),
+                )
+                for admin_id, username in admins
+            ],
+        )
+    else:
+        await conn.executemany(
+            """
+            INSERT INTO administrators (
+                admin_id, username, credits, moderation_mode,
+                created_at, last_active
+            ) VALUES ($1, $2, $3, $4, NOW(), NOW())
+            ON CONFLICT (admin_id) DO UPDATE SET
+                username = COALESCE(administrators.username, EXCLUDED.username)
+            """,
+            [
+                (admin_id, username, INITIAL_CREDITS, mode.value)
+                for admin_id, username in admins
+            ],
+        )
+
+
 async def update_admin_language(admin_id: int, language_code: str) -> None:
     """Update administrator's preferred language. Supports 'ru' and 'en'."""
     pool = await get_pool()
@@ -130,12 +176,17 @@ async def update_admin_username_if_needed(admin_id: int, username: str | None) -
         await save_admin(admin)
 
 
-async def record_successful_payment(admin_id: int, stars_amount: int) -> None:
-    """Record a successful Stars payment: add credits, record transaction, enable moderation."""
+async def record_successful_payment(admin_id: int, stars_amount: int) -> Optional[str]:
+    """
+    Record a successful Stars payment: add credits, record transaction, enable moderation.
+
+    Returns the admin's stored language_code, which the payment function hands
+    back in the same round trip.
+    """
     pool = await get_pool()
     async with pool.acquire() as conn:
-        await conn.execute(
-            "CALL process_successful_payment($1, $2)",
+        return await conn.fetchval(
+            "SELECT apply_successful_payment($1, $2)",
             admin_id,
             stars_amount,
         )
@@ -7,10 +7,10 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 
 try:
-    import yaml
+    from ..common.utils import load_config
 
-    with open("config.yaml", "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    # Shared cached parse of config.yaml
+    config = load_config()
 
     pricing = config.get("pricing", {})
 
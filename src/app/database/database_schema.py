@@ -165,6 +165,10 @@ async def create_schema(conn: asyncpg.Connection):
             CREATE INDEX IF NOT EXISTS idx_groups_moderation ON groups(moderation_enabled);
             CREATE INDEX IF NOT EXISTS idx_groups_last_active ON groups(last_active);
 
+            -- Group administrators: lookups by admin (the PK leads with group_id)
+            CREATE INDEX IF NOT EXISTS idx_group_administrators_admin
+                ON group_administrators (admin_id, group_id);
+
             -- Message history indexes
             CREATE INDEX IF NOT EXISTS idx_message_history_admin ON message_history(admin_id);
             CREATE INDEX IF NOT EXISTS idx_message_history_created ON message_history(created_at);
@@ -250,13 +254,17 @@ async def create_procedures(conn: asyncpg.Connection):
             END;
             $$;
 
-            -- Process successful payment (без рефералов)
-            CREATE OR REPLACE PROCEDURE process_successful_payment(
+            -- Apply a successful payment (без рефералов); returns the payer's
+            -- language_code so the caller needs no follow-up SELECT
+            CREATE OR REPLACE FUNCTION apply_successful_payment(
                 p_admin_id BIGINT,
                 p_stars_amount INTEGER
             )
+            RETURNS VARCHAR
             LANGUAGE plpgsql
             AS $$
+            DECLARE
+                v_language_code VARCHAR;
             BEGIN
                 -- Add credits to the user
                 INSERT INTO administrators (admin_id, credits, created_at, last_active)
@@ -265,7 +273,8 @@ async def create_procedures(conn: asyncpg.Connection):
                 SET credits = administrators.credits + p_stars_amount,
                     last_active = NOW(),
                     credits_depleted_at = NULL,
-                    low_balance_warned_at = NULL;
+                    low_balance_warned_at = NULL
+                RETURNING language_code INTO v_language_code;
 
                 -- Record payment transaction
                 INSERT INTO transactions (
@@ -280,13 +289,29 @@ async def create_procedures(conn: asyncpg.Connection):
                     'Stars purchase'
                 );
 
-                -- Enable moderation in all user's groups
+                -- Re-enable moderation in the user's groups (single set-based UPDATE;
+                -- groups that are already enabled are left untouched)
                 UPDATE groups g
                 SET moderation_enabled = true,
                 last_active = NOW()
                 FROM group_administrators ga
                 WHERE g.group_id = ga.group_id
-                AND ga.admin_id = p_admin_id;
+                AND ga.admin_id = p_admin_id
+                AND g.moderation_enabled IS DISTINCT FROM true;
+
+                RETURN v_language_code;
+            END;
+            $$;
+
+            -- Kept for callers deployed before apply_successful_payment existed
+            CREATE OR REPLACE PROCEDURE process_successful_payment(
+                p_admin_id BIGINT,
+                p_stars_amount INTEGER
+            )
+            LANGUAGE plpgsql
+            AS $$
+            BEGIN
+                PERFORM apply_successful_payment(p_admin_id, p_stars_amount);
             END;
             $$;
             """
@@ -1,16 +1,22 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional, cast
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple, cast
 
 from aiogram.exceptions import TelegramBadRequest
 
 from ..common.bot import bot
 from ..common.utils import load_config
-from . import admin_operations
+from ..common.write_behind import WriteBehindQueue
+from .admin_operations import upsert_admins
 from .models import Group
 from .postgres_connection import get_pool
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent bot.get_chat calls per get_admin_groups call
+MAX_PARALLEL_CHAT_LOOKUPS = 10
+
 
 async def get_group(group_id: int) -> Optional[Group]:
     """Retrieve group information"""
@@ -101,9 +107,32 @@ async def get_paying_admins(group_id: int) -> List[int]:
         return [row["admin_id"] for row in rows]
 
 
-async def deduct_credits_from_admins(group_id: int, amount: int) -> int:
+async def get_groups_with_paying_admins(group_ids: List[int]) -> Set[int]:
+    """Return the subset of group_ids that have at least one admin with positive credits"""
+    if not group_ids:
+        return set()
+
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT DISTINCT ga.group_id
+            FROM group_administrators ga
+            JOIN administrators a ON a.admin_id = ga.admin_id
+            WHERE ga.group_id = ANY($1) AND a.credits > 0
+        """,
+            group_ids,
+        )
+        return {row["group_id"] for row in rows}
+
+
+async def deduct_credits_from_admins(
+    group_id: int, amount: int, *, disable_on_failure: bool = False
+) -> int:
     """
-    Deduct credits from the admin with the highest balance
+    Deduct credits from the admin with the highest balance.
+    With disable_on_failure, moderation is switched off in the same transaction
+    when no admin can pay, so the decision is atomic.
     Returns:
         int: admin_id if credits were successfully deducted, 0 if deduction failed
     """
@@ -124,6 +153,15 @@ async def deduct_credits_from_admins(group_id: int, amount: int) -> int:
             )
 
             if not admin_row or admin_row["credits"] < amount:
+                if disable_on_failure:
+                    await conn.execute(
+                        """
+                        UPDATE groups
+                        SET moderation_enabled = false, last_active = NOW()
+                        WHERE group_id = $1
+                    """,
+                        group_id,
+                    )
                 return 0
 
             # Deduct credits and record transaction
@@ -260,46 +298,51 @@ async def get_admin_groups(admin_id: int) -> List[Dict]:
             admin_id,
         )
 
-        groups = []
-        inaccessible_groups = []
+    # Chat titles come from Telegram: fetch them concurrently, without holding
+    # a pool connection, instead of one sequential round trip per group; the
+    # semaphore keeps an admin of many groups from bursting Telegram's limits
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_CHAT_LOOKUPS)
 
-        for row in rows:
-            try:
+    async def fetch_group(row) -> Tuple[Optional[Dict], bool]:
+        """Return (group, inaccessible)."""
+        try:
+            async with semaphore:
                 chat = await bot.get_chat(row["group_id"])
-                groups.append(
-                    {
-                        "id": row["group_id"],
-                        "title": chat.title,
-                        "is_moderation_enabled": row["moderation_enabled"],
-                    }
-                )
-            except TelegramBadRequest as e:
-                if "chat not found" in str(e).lower():
-                    logger.warning(
-                        f"Chat {row['group_id']} not found, will clean up",
-                        exc_info=True,
-                    )
-                    inaccessible_groups.append(row["group_id"])
-                else:
-                    logger.error(
-                        f"Telegram error getting chat {row['group_id']}: {e}",
-                        exc_info=True,
-                    )
-                continue
-            except Exception as e:
-                logger.error(
-                    f"Error getting chat {row['group_id']}: {e}", exc_info=True
+        except TelegramBadRequest as e:
+            if "chat not found" in str(e).lower():
+                logger.warning(
+                    f"Chat {row['group_id']} not found, will clean up",
+                    exc_info=True,
                 )
-                continue
+                return None, True
+            logger.error(
+                f"Telegram error getting chat {row['group_id']}: {e}",
+                exc_info=True,
+            )
+            return None, False
+        except Exception as e:
+            logger.error(f"Error getting chat {row['group_id']}: {e}", exc_info=True)
+            return None, False
+        return {
+            "id": row["group_id"],
+            "title": chat.title,
+            "is_moderation_enabled": row["moderation_enabled"],
+        }, False
+
+    results = await asyncio.gather(*(fetch_group(row) for row in rows))
 
-        # Clean up inaccessible groups (after the loop to avoid connection issues)
-        for group_id in inaccessible_groups:
-            try:
-                await cleanup_group_data(group_id)
-            except Exception as e:
-                logger.error(f"Failed to cleanup inaccessible group {group_id}: {e}")
+    groups = [group for group, _ in results if group is not None]
+    inaccessible_groups = [
+        row["group_id"] for row, (_, inaccessible) in zip(rows, results) if inaccessible
+    ]
 
-        return groups
+    for group_id in inaccessible_groups:
+        try:
+            await cleanup_group_data(group_id)
+        except Exception as e:
+            logger.error(f"Failed to cleanup inaccessible group {group_id}: {e}")
+
+    return groups
 
 
 def get_probation_min_events() -> int:
@@ -329,21 +372,37 @@ async def is_trusted_member(group_id: int, member_id: int) -> bool:
     return count >= get_probation_min_events()
 
 
-async def increment_moderation_events(group_id: int, member_id: int) -> None:
-    """Increment moderation event counter for an approved member."""
+async def _write_moderation_events(members: List[Tuple[int, int]]) -> None:
+    """Apply queued counter increments, one row update per distinct member."""
+    increments = Counter(members)
     pool = await get_pool()
     async with pool.acquire() as conn:
-        await conn.execute(
+        await conn.executemany(
             """
             UPDATE approved_members
-            SET moderation_event_count = moderation_event_count + 1
-            WHERE group_id = $1 AND member_id = $2
+            SET moderation_event_count = moderation_event_count + $1
+            WHERE group_id = $2 AND member_id = $3
             """,
-            group_id,
-            member_id,
+            [
+                (count, group_id, member_id)
+                for (group_id, member_id), count in increments.items()
+            ],
         )
 
 
+# Probation counters are bookkeeping the moderation reply does not depend on,
+# so increments are applied in the background. Started/stopped by app.main;
+# writes through when not running.
+moderation_events_queue: WriteBehindQueue[Tuple[int, int]] = WriteBehindQueue(
+    "moderation_events", _write_moderation_events
+)
+
+
+async def increment_moderation_events(group_id: int, member_id: int) -> None:
+    """Increment moderation event counter for an approved member."""
+    await moderation_events_queue.submit((group_id, member_id))
+
+
 async def set_moderation_events(group_id: int, member_id: int, count: int) -> None:
     """Set moderation event count (upsert for admin instant trust)."""
     pool = await get_pool()
@@ -482,30 +541,14 @@ async def update_group_admins(
                     "admin_ids and admin_usernames must have the same length"
                 )
 
-            # Add/update admins
-            for admin_id, username in zip(admin_ids, usernames):
-                # Save or update admin with username if provided
-                admin = await admin_operations.get_admin(admin_id)
-                if admin is None:
-                    # Create new admin
-                    admin = admin_operations.Administrator(
-                        admin_id=admin_id,
-                        username=username,
-                        credits=admin_operations.INITIAL_CREDITS,
-                        moderation_mode=admin_operations.ModerationMode.NOTIFY,
-                    )
-                elif admin.username is None and username is not None:
-                    admin.username = username
-
-                await admin_operations.save_admin(admin)
+            await upsert_admins(conn, zip(admin_ids, usernames))
 
-                # Add as group administrator
-                await conn.execute(
-                    """
-                    INSERT INTO group_administrators (group_id, admin_id)
-                    VALUES ($1, $2)
-                    ON CONFLICT DO NOTHING
-                    """,
-                    group_id,
-                    admin_id,
-                )
+            # Add as group administrators
+            await conn.executemany(
+                """
+                INSERT INTO group_administrators (group_id, admin_id)
+                VALUES ($1, $2)
+                ON CONFLICT DO NOTHING
+                """,
+                [(group_id, admin_id) for admin_id in admin_ids],
+            )
@@ -9,8 +9,9 @@ messages to add spam examples. Replaces Logfire-based lookup.
 import logging
 import re
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence, Tuple
 
+from ..common.write_behind import WriteBehindQueue
 from .postgres_connection import get_pool
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,52 @@ def _build_text_like_pattern(message_text: str) -> str:
     return message_text[:100].replace("%", "\\%")
 
 
+_UPSERT_LOOKUP_ENTRY = """
+    INSERT INTO message_lookup_cache (
+        chat_id, message_id, effective_user_id, message_text,
+        reply_to_text, stories_context, account_signals_context
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    ON CONFLICT (chat_id, message_id) DO UPDATE SET
+        effective_user_id = EXCLUDED.effective_user_id,
+        message_text = EXCLUDED.message_text,
+        reply_to_text = COALESCE(EXCLUDED.reply_to_text, message_lookup_cache.reply_to_text),
+        stories_context = COALESCE(EXCLUDED.stories_context, message_lookup_cache.stories_context),
+        account_signals_context = COALESCE(EXCLUDED.account_signals_context, message_lookup_cache.account_signals_context),
+        created_at = NOW()
+"""
+
+LookupEntry = Tuple[int, int, int, str, Optional[str], Optional[str], Optional[str]]
+
+
+async def _write_lookup_entries(entries: List[LookupEntry]) -> None:
+    """Upsert a batch of lookup entries in one round trip."""
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        await conn.executemany(_UPSERT_LOOKUP_ENTRY, entries)
+
+
+def _merge_lookup_entries(older: LookupEntry, newer: LookupEntry) -> LookupEntry:
+    """Collapse two queued writes of one message the way the upsert would."""
+    # Same COALESCE rules as _UPSERT_LOOKUP_ENTRY for the optional context
+    # fields, so a later entry without them does not erase an earlier one's
+    return (
+        *newer[:4],
+        *(new if new is not None else old for old, new in zip(older[4:], newer[4:])),
+    )  # type: ignore[return-value]
+
+
+# Lookup entries are only read when an admin later forwards a message, so the
+# moderation pipeline hands them off instead of waiting for the upsert.
+# Started/stopped by app.main; writes through when not running.
+lookup_write_queue: WriteBehindQueue[LookupEntry] = WriteBehindQueue(
+    "message_lookup_cache",
+    _write_lookup_entries,
+    key=lambda entry: (entry[0], entry[1]),
+    merge=_merge_lookup_entries,
+)
+
+
 async def save_message_lookup_entry(
     chat_id: int,
     message_id: int,
@@ -38,23 +85,8 @@ async def save_message_lookup_entry(
     account_signals_context: Optional[str] = None,
 ) -> None:
     """Upsert message metadata and optional classification context into lookup cache."""
-    pool = await get_pool()
-    async with pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO message_lookup_cache (
-                chat_id, message_id, effective_user_id, message_text,
-                reply_to_text, stories_context, account_signals_context
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            ON CONFLICT (chat_id, message_id) DO UPDATE SET
-                effective_user_id = EXCLUDED.effective_user_id,
-                message_text = EXCLUDED.message_text,
-                reply_to_text = COALESCE(EXCLUDED.reply_to_text, message_lookup_cache.reply_to_text),
-                stories_context = COALESCE(EXCLUDED.stories_context, message_lookup_cache.stories_context),
-                account_signals_context = COALESCE(EXCLUDED.account_signals_context, message_lookup_cache.account_signals_context),
-                created_at = NOW()
-            """,
+    await lookup_write_queue.submit(
+        (
             chat_id,
             message_id,
             effective_user_id,
@@ -63,6 +95,7 @@ async def save_message_lookup_entry(
             stories_context[:10000] if stories_context else None,
             account_signals_context[:2000] if account_signals_context else None,
         )
+    )
 
 
 async def find_message_by_text_and_user(
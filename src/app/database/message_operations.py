@@ -1,6 +1,7 @@
 import logging
-from typing import List
+from typing import List, Sequence, Tuple
 
+from ..common.ttl_cache import TTLCache
 from .postgres_connection import get_pool
 
 logger = logging.getLogger(__name__)
@@ -8,20 +9,29 @@ logger = logging.getLogger(__name__)
 MESSAGE_HISTORY_SIZE = 30
 MESSAGE_TTL = 60 * 60 * 24  # 24 hours
 
+# Recent conversation per admin. This process is the only writer, so entries
+# are updated in place on save instead of being re-read from the database.
+_history_cache: TTLCache[List[dict]] = TTLCache(ttl=60 * 60, maxsize=10_000)
+
 
 async def save_message(admin_id: int, role: str, content: str) -> None:
     """Save a message to the admin's conversation history"""
+    await save_messages(admin_id, [(role, content)])
+
+
+async def save_messages(admin_id: int, messages: Sequence[Tuple[str, str]]) -> None:
+    """Save several (role, content) messages in order, trimming history once"""
+    if not messages:
+        return
     pool = await get_pool()
     async with pool.acquire() as conn:
         async with conn.transaction():
-            await conn.execute(
+            await conn.executemany(
                 """
                 INSERT INTO message_history (admin_id, role, content, created_at)
                 VALUES ($1, $2, $3, NOW())
             """,
-                admin_id,
-                role,
-                content,
+                [(admin_id, role, content) for role, content in messages],
             )
 
             count = await conn.fetchval(
@@ -39,7 +49,7 @@ async def save_message(admin_id: int, role: str, content: str) -> None:
                     WHERE id IN (
                         SELECT id FROM message_history
                         WHERE admin_id = $1
-                        ORDER BY created_at ASC
+                        ORDER BY created_at ASC, id ASC
                         LIMIT $2
                     )
                 """,
@@ -47,6 +57,11 @@ async def save_message(admin_id: int, role: str, content: str) -> None:
                     count - MESSAGE_HISTORY_SIZE,
                 )
 
+    cached = _history_cache.get(admin_id)
+    if cached is not None:
+        cached.extend({"role": role, "content": content} for role, content in messages)
+        del cached[:-MESSAGE_HISTORY_SIZE]
+
 
 async def cleanup_old_message_history(days: int = 1) -> int:
     """Remove message_history rows older than specified days. Returns deleted count."""
@@ -58,12 +73,17 @@ async def cleanup_old_message_history(days: int = 1) -> int:
         )
     count = int(result.split()[-1]) if result else 0
     if count > 0:
+        _history_cache.clear()
         logger.info(f"Cleaned up {count} old message_history entries")
     return count
 
 
 async def get_message_history(admin_id: int) -> List[dict]:
     """Retrieve admin's conversation history"""
+    cached = _history_cache.get(admin_id)
+    if cached is not None:
+        return list(cached)
+
     pool = await get_pool()
     async with pool.acquire() as conn:
         rows = await conn.fetch(
@@ -71,12 +91,14 @@ async def get_message_history(admin_id: int) -> List[dict]:
             SELECT role, content
             FROM message_history
             WHERE admin_id = $1
-            ORDER BY created_at ASC
+            ORDER BY created_at ASC, id ASC
         """,
             admin_id,
         )
 
-        return [{"role": row["role"], "content": row["content"]} for row in rows]
+    history = [{"role": row["role"], "content": row["content"]} for row in rows]
+    _history_cache.set(admin_id, history)
+    return list(history)
 
 
 async def clear_message_history(admin_id: int) -> None:
@@ -89,3 +111,4 @@ async def clear_message_history(admin_id: int) -> None:
         """,
             admin_id,
         )
+    _history_cache.pop(admin_id)
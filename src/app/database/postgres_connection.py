@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from typing import Optional
@@ -10,24 +11,32 @@ logger = logging.getLogger(__name__)
 _pool: Optional[asyncpg.Pool] = None
 
 
+_pool_lock = asyncio.Lock()
+
+
 @logfire.no_auto_trace
 async def get_pool() -> asyncpg.Pool:
     """Get or create PostgreSQL connection pool"""
     global _pool
-    if _pool is None:
-        try:
-            _pool = await asyncpg.create_pool(
-                host=os.getenv("PG_HOST", "localhost"),
-                port=int(os.getenv("PG_PORT", "5432")),
-                user=os.getenv("PG_USER", "postgres"),
-                password=os.getenv("PG_PASSWORD", ""),
-                database=os.getenv("PG_DB", "ai_spam_bot"),
-                min_size=1,
-                max_size=5,
-            )
-        except Exception as e:
-            logger.error(f"Failed to create database pool: {e}")
-            raise
+    if _pool is not None:
+        return _pool
+    # Concurrent first callers (startup warm-up racing the first update) must
+    # share one pool rather than each creating and leaking their own
+    async with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = await asyncpg.create_pool(
+                    host=os.getenv("PG_HOST", "localhost"),
+                    port=int(os.getenv("PG_PORT", "5432")),
+                    user=os.getenv("PG_USER", "postgres"),
+                    password=os.getenv("PG_PASSWORD", ""),
+                    database=os.getenv("PG_DB", "ai_spam_bot"),
+                    min_size=1,
+                    max_size=5,
+                )
+            except Exception as e:
+                logger.error(f"Failed to create database pool: {e}")
+                raise
     return _pool
 
 
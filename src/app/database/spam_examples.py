@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 
 import logfire
 
+from ..common.ttl_cache import TTLCache
 from ..common.utils import clean_alert_text, load_config
 from .postgres_connection import get_pool
 
@@ -11,6 +12,13 @@ logger = logging.getLogger(__name__)
 PENDING_SCORE = -100
 SPAM_CONFIRMED_SCORE = 100
 
+# Confirmed examples change on the order of minutes but are read for every
+# classification and private message; writes below invalidate the cache.
+_examples_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(
+    ttl=load_config().get("cache", {}).get("spam_examples_ttl_seconds", 30),
+    maxsize=256,
+)
+
 
 @logfire.no_auto_trace
 @logfire.instrument(extract_args=True)
@@ -109,6 +117,8 @@ async def confirm_pending_example_as_not_spam(
             admin_id,
             pending_id,
         )
+        if row:
+            _examples_cache.clear()
         if not row or row["chat_id"] is None:
             return None
         return {
@@ -140,7 +150,10 @@ async def confirm_pending_example_as_spam(
             chat_id,
             message_id,
         )
-        return result != "UPDATE 0"
+        updated = result != "UPDATE 0"
+        if updated:
+            _examples_cache.clear()
+        return updated
 
 
 async def get_pending_example_by_message(
@@ -176,9 +189,19 @@ async def get_spam_examples(
     """Get spam examples from PostgreSQL with proportional ham/spam mix.
     With admin_ids, includes user-specific examples.
     Uses examples_limit and examples_ham_ratio / examples_spam_ratio from config.
-    Prefers most recent examples within each category."""
+    Prefers most recent examples within each category.
+    Results are cached for a short TTL; callers must not mutate them."""
     cfg_limit, ham_ratio, spam_ratio = _get_examples_config()
     total_limit = limit if limit is not None else cfg_limit
+    cache_key = (
+        tuple(sorted(set(admin_ids))) if admin_ids else None,
+        total_limit,
+        ham_ratio,
+    )
+    cached = _examples_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     ham_limit = max(1, round(total_limit * ham_ratio))
     spam_limit = max(1, round(total_limit * spam_ratio))
 
@@ -232,7 +255,7 @@ async def get_spam_examples(
     combined = list(ham_rows) + list(spam_rows)
     combined.sort(key=lambda r: r["created_at"], reverse=True)
 
-    return [
+    examples = [
         {
             "text": row["text"],
             "name": row["name"],
@@ -245,6 +268,8 @@ async def get_spam_examples(
         }
         for row in combined
     ]
+    _examples_cache.set(cache_key, examples)
+    return examples
 
 
 @logfire.no_auto_trace
@@ -304,6 +329,7 @@ async def add_spam_example(
                     reply_context,
                     account_signals_context,
                 )
+                _examples_cache.clear()
                 return True
             except Exception as e:
                 logger.error(f"Error adding spam example: {e}")
@@ -0,0 +1,31 @@
+"""
+Typed callback_data for inline keyboards on admin spam notifications and
+forwarded-message prompts.
+
+Prefixes and field order match the legacy ``prefix:field:...`` strings, so
+buttons on notifications sent before the switch keep working.
+"""
+
+from typing import Literal
+
+from aiogram.filters.callback_data import CallbackData
+
+
+class DeleteSpamCallback(CallbackData, prefix="delete_spam_message"):
+    """Delete the original message and ban its sender (notify mode)."""
+
+    user_id: int
+    chat_id: int
+    message_id: int
+
+
+class MarkNotSpamCallback(CallbackData, prefix="mark_as_not_spam"):
+    """Confirm a pending example as not spam and restore the sender."""
+
+    pending_id: int
+
+
+class SpamExampleCallback(CallbackData, prefix="spam_example"):
+    """Store a forwarded message as a spam or not-spam example."""
+
+    action: Literal["spam", "not_spam"]
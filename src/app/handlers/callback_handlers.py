@@ -16,6 +16,7 @@ from ..database.spam_examples import (
     confirm_pending_example_as_spam,
 )
 from ..i18n import HELP_PAGE_CALLBACK_KEYS, resolve_lang, t
+from .callback_data import DeleteSpamCallback, MarkNotSpamCallback
 from .dp import dp
 from .handle_spam import ban_user_for_spam
 
@@ -140,8 +141,10 @@ async def handle_help_back(callback: CallbackQuery) -> str:
     return "help_back_shown"
 
 
-@dp.callback_query(F.data.startswith("mark_as_not_spam:"))
-async def handle_spam_ignore_callback(callback: CallbackQuery) -> str:
+@dp.callback_query(MarkNotSpamCallback.filter())
+async def handle_spam_ignore_callback(
+    callback: CallbackQuery, callback_data: MarkNotSpamCallback
+) -> str:
     """
     Обработчик колбэка для подтверждения сообщения как не спам.
     Callback data: mark_as_not_spam:{pending_id}
@@ -158,15 +161,7 @@ async def handle_spam_ignore_callback(callback: CallbackQuery) -> str:
             await callback.answer(
                 f"✅ {t(lang, 'callback.safe_added')}", show_alert=False
             )
-        parts = callback.data.split(":")
-        if len(parts) < 2:
-            return "callback_invalid_data_format"
-
-        try:
-            pending_id = int(parts[1])
-        except ValueError:
-            return "callback_invalid_data_format"
-
+        pending_id = callback_data.pending_id
         row = await confirm_pending_example_as_not_spam(pending_id, admin_id)
 
         message = callback.message
@@ -240,8 +235,10 @@ async def handle_spam_ignore_callback(callback: CallbackQuery) -> str:
         return "callback_error_marking_not_spam"
 
 
-@dp.callback_query(F.data.startswith("delete_spam_message:"))
-async def handle_spam_confirm_callback(callback: CallbackQuery) -> str:
+@dp.callback_query(DeleteSpamCallback.filter())
+async def handle_spam_confirm_callback(
+    callback: CallbackQuery, callback_data: DeleteSpamCallback
+) -> str:
     """
     Handle "Delete" button in notify mode: delete original message, ban spammer,
     remove notification keyboard. Marks pending spam example as confirmed.
@@ -257,10 +254,9 @@ async def handle_spam_confirm_callback(callback: CallbackQuery) -> str:
             await callback.answer(
                 f"✅ {t(lang, 'callback.spam_deleted')}", show_alert=False
             )
-        _, effective_user_id_str, chat_id_str, message_id_str = callback.data.split(":")
-        effective_user_id = int(effective_user_id_str)
-        chat_id = int(chat_id_str)
-        message_id = int(message_id_str)
+        effective_user_id = callback_data.user_id
+        chat_id = callback_data.chat_id
+        message_id = callback_data.message_id
 
         if not callback.message:
             logger.warning("No notification message in callback")
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import html
 import logging
@@ -20,7 +21,6 @@ from ..database import (
     get_admin_credits,
     get_admin_stats,
     cycle_moderation_mode,
-    get_moderation_mode,
     get_spent_credits_last_week,
     initialize_new_admin,
     update_admin_username_if_needed,
@@ -317,9 +317,11 @@ async def handle_stats_command(message: types.Message) -> str:
     lang = resolve_lang(message, admin)
 
     try:
-        balance = await get_admin_credits(user_id)
-        spent_week = await get_spent_credits_last_week(user_id)
-        admin_stats = await get_admin_stats(user_id)
+        balance, spent_week, admin_stats = await asyncio.gather(
+            get_admin_credits(user_id),
+            get_spent_credits_last_week(user_id),
+            get_admin_stats(user_id),
+        )
         global_stats = admin_stats["global"]
         groups = admin_stats["groups"]
 
@@ -362,7 +364,10 @@ async def handle_stats_command(message: types.Message) -> str:
         else:
             message_text += t(lang, "stats.no_groups")
 
-        moderation_mode = await get_moderation_mode(user_id)
+        # The admin row read above already carries the mode; no second query
+        moderation_mode = (
+            admin.moderation_mode if admin is not None else ModerationMode.NOTIFY
+        )
         mode_key = {
             ModerationMode.NOTIFY: "stats.mode_notify",
             ModerationMode.DELETE: "stats.mode_delete",
@@ -402,8 +407,14 @@ async def handle_mode_command(message: types.Message) -> str:
             return "command_mode_error"
 
         mode_messages = {
-            ModerationMode.NOTIFY: ("mode.notify_enabled", "command_mode_changed_to_notification"),
-            ModerationMode.DELETE: ("mode.delete_enabled", "command_mode_changed_to_deletion"),
+            ModerationMode.NOTIFY: (
+                "mode.notify_enabled",
+                "command_mode_changed_to_notification",
+            ),
+            ModerationMode.DELETE: (
+                "mode.delete_enabled",
+                "command_mode_changed_to_deletion",
+            ),
             ModerationMode.DELETE_SILENT: (
                 "mode.delete_silent_enabled",
                 "command_mode_changed_to_delete_silent",
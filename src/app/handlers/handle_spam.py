@@ -23,6 +23,7 @@ from ..common.utils import (
 )
 from ..database import get_admin, get_admins_map
 from ..database.models import Administrator
+from .callback_data import DeleteSpamCallback, MarkNotSpamCallback
 from ..i18n import normalize_lang, resolve_lang, t
 from ..database.group_operations import (
     remove_member_from_group,
@@ -38,11 +39,15 @@ logger = logging.getLogger(__name__)
 async def _get_notification_lang(
     admin_ids: list[int],
     fallback_user: Optional[types.User] = None,
+    admins_map: Optional[dict[int, Administrator]] = None,
 ) -> str:
     """Resolve language for spam notifications from admin preferences or user fallback."""
     if not admin_ids:
         return "en"
-    admin = await get_admin(admin_ids[0])
+    if admins_map is not None:
+        admin = admins_map.get(admin_ids[0])
+    else:
+        admin = await get_admin(admin_ids[0])
     if admin and admin.language_code:
         return normalize_lang(admin.language_code)
     return resolve_lang(fallback_user, None) if fallback_user else "en"
@@ -63,7 +68,9 @@ async def handle_spam(
             logger.warning("Message without user info, skipping spam handling")
             return "spam_no_user_info"
 
-        all_admins_delete = await check_admin_delete_preferences(admin_ids)
+        # One query serves the delete-mode check, language and per-admin tips
+        admins_map = await get_admins_map(admin_ids)
+        all_admins_delete = await check_admin_delete_preferences(admin_ids, admins_map)
         effective_all_admins_delete = all_admins_delete and not skip_auto_delete
 
         notification_sent = await notify_admins(
@@ -74,6 +81,7 @@ async def handle_spam(
             message_context_result,
             is_low_confidence_not_spam=is_low_confidence_not_spam,
             confidence=confidence,
+            admins_map=admins_map,
         )
 
         if (
@@ -88,6 +96,8 @@ async def handle_spam(
             if effective_user_id is None:
                 logger.warning("Message without effective user info, skipping ban")
                 return "spam_no_user_info"
+            # Delete before banning: in supergroups the ban revokes the user's
+            # messages, so a concurrent delete would race it
             await handle_spam_message_deletion(message, admin_ids)
             await ban_user_for_spam(
                 message.chat.id, effective_user_id, admin_ids, message.chat.title
@@ -99,16 +109,20 @@ async def handle_spam(
         )
 
     except Exception as e:
-        logger.error(f"Error handling spam: {e}", exc_info=True)
+        logger.error("Error handling spam: %s", e, exc_info=True)
         raise
 
 
-async def check_admin_delete_preferences(admin_ids: list[int]) -> bool:
+async def check_admin_delete_preferences(
+    admin_ids: list[int],
+    admins_map: Optional[dict[int, Administrator]] = None,
+) -> bool:
     """Return True if all admins have auto-delete enabled (delete or delete_silent)."""
     if not admin_ids:
         return False
 
-    admins_map = await get_admins_map(admin_ids)
+    if admins_map is None:
+        admins_map = await get_admins_map(admin_ids)
     for admin_id in admin_ids:
         admin_user = admins_map.get(admin_id)
         if not admin_user or not admin_user.auto_deletes_spam:
@@ -140,16 +154,21 @@ def create_admin_notification_keyboard(
     if effective_user_id is None or pending_id is None:
         return InlineKeyboardMarkup(inline_keyboard=[[]])
 
+    not_spam_data = MarkNotSpamCallback(pending_id=pending_id).pack()
     if not all_admins_delete:
         row = [
             InlineKeyboardButton(
                 text=t(lang, "spam.delete_button"),
-                callback_data=f"delete_spam_message:{effective_user_id}:{message.chat.id}:{message.message_id}",
+                callback_data=DeleteSpamCallback(
+                    user_id=effective_user_id,
+                    chat_id=message.chat.id,
+                    message_id=message.message_id,
+                ).pack(),
                 style="danger",
             ),
             InlineKeyboardButton(
                 text=t(lang, "spam.not_spam_button"),
-                callback_data=f"mark_as_not_spam:{pending_id}",
+                callback_data=not_spam_data,
                 style="success",
             ),
         ]
@@ -157,7 +176,7 @@ def create_admin_notification_keyboard(
         row = [
             InlineKeyboardButton(
                 text=t(lang, "spam.not_spam_confirm"),
-                callback_data=f"mark_as_not_spam:{pending_id}",
+                callback_data=not_spam_data,
                 style="success",
             ),
         ]
@@ -218,7 +237,10 @@ async def handle_permission_error(
 
     if is_permission_error:
         logger.warning(
-            f"Cannot {action_description} in chat {chat_id}: {error}",
+            "Cannot %s in chat %s: %s",
+            action_description,
+            chat_id,
+            error,
             exc_info=True,
         )
         await set_no_rights_detected_at(chat_id)
@@ -245,7 +267,9 @@ async def handle_permission_error(
                 )
             except Exception as notify_exc:
                 logger.warning(
-                    f"Failed to notify admins about missing rights for {action_description}: {notify_exc}"
+                    "Failed to notify admins about missing rights for %s: %s",
+                    action_description,
+                    notify_exc,
                 )
         return True
 
@@ -334,18 +358,20 @@ async def notify_admins(
     message_context_result: Optional["MessageContextResult"] = None,
     is_low_confidence_not_spam: bool = False,
     confidence: Optional[int] = None,
+    admins_map: Optional[dict[int, Administrator]] = None,
 ) -> bool:
     """Notify admins about spam. Returns True if at least one notification succeeded."""
     if not message.from_user:
         return False
 
-    lang = await _get_notification_lang(admin_ids, message.from_user)
+    if admins_map is None:
+        admins_map = await get_admins_map(admin_ids)
+    lang = await _get_notification_lang(admin_ids, message.from_user, admins_map)
 
     context = MessageNotificationContext.from_message(message)
 
     recipient_ids = admin_ids
     if all_admins_delete:
-        admins_map = await get_admins_map(admin_ids)
         recipient_ids = filter_admins_for_auto_delete_notification(
             admin_ids, admins_map
         )
@@ -363,20 +389,23 @@ async def notify_admins(
             confidence=confidence,
         )
     else:
-        admins_map = await get_admins_map(admin_ids)
+        # Only include_mode_tip varies per admin: render each variant once
+        rendered: dict[bool, str] = {}
 
         def message_for_admin(admin_id: int) -> str:
             admin = admins_map.get(admin_id)
             include_mode_tip = not (admin and admin.auto_deletes_spam)
-            return format_admin_notification_message(
-                context,
-                all_admins_delete,
-                reason,
-                lang=lang,
-                is_low_confidence_not_spam=is_low_confidence_not_spam,
-                confidence=confidence,
-                include_mode_tip=include_mode_tip,
-            )
+            if include_mode_tip not in rendered:
+                rendered[include_mode_tip] = format_admin_notification_message(
+                    context,
+                    all_admins_delete,
+                    reason,
+                    lang=lang,
+                    is_low_confidence_not_spam=is_low_confidence_not_spam,
+                    confidence=confidence,
+                    include_mode_tip=include_mode_tip,
+                )
+            return rendered[include_mode_tip]
 
         private_message = message_for_admin
 
@@ -447,7 +476,7 @@ async def handle_spam_message_deletion(
 
         await delete_spam_message()
         logger.info(
-            f"Deleted spam message {message.message_id} in chat {message.chat.id}"
+            "Deleted spam message %s in chat %s", message.message_id, message.chat.id
         )
     except TelegramBadRequest as e:
         lang = await _get_notification_lang(admin_ids)
@@ -464,7 +493,10 @@ async def handle_spam_message_deletion(
         ):
             # Not a permission error, log as general error
             logger.warning(
-                f"Could not delete spam message {message.message_id} in chat {message.chat.id}: {e}",
+                "Could not delete spam message %s in chat %s: %s",
+                message.message_id,
+                message.chat.id,
+                e,
                 exc_info=True,
             )
 
@@ -486,7 +518,7 @@ async def ban_user_for_spam(
             return await bot.ban_chat_member(chat_id, user_id)
 
         await ban_spam_user()
-        logger.info(f"Banned user {user_id} in chat {chat_id} for spam")
+        logger.info("Banned user %s in chat %s for spam", user_id, chat_id)
     except TelegramBadRequest as e:
         lang = await _get_notification_lang(admin_ids or [])
         perm_name = t(lang, "spam.permission_ban")
@@ -501,17 +533,24 @@ async def ban_user_for_spam(
         ):
             # Not a permission error, log as general error
             logger.warning(
-                f"Failed to ban user {user_id} in chat {chat_id}: {e}", exc_info=True
+                "Failed to ban user %s in chat %s: %s",
+                user_id,
+                chat_id,
+                e,
+                exc_info=True,
             )
     except Exception as e:
         logger.warning(
-            f"Failed to ban user {user_id} in chat {chat_id}: {e}", exc_info=True
+            "Failed to ban user %s in chat %s: %s", user_id, chat_id, e, exc_info=True
         )
     try:
         await remove_member_from_group(user_id, chat_id)
     except Exception as e:
         logger.warning(
-            f"Failed to remove user {user_id} from approved_members: {e}", exc_info=True
+            "Failed to remove user %s from approved_members: %s",
+            user_id,
+            e,
+            exc_info=True,
         )
 
 
@@ -648,7 +687,8 @@ async def notify_spam_contacts_via_mcp(
                     admin_count += 1
 
         logger.info(
-            f"Sent spam notifications to {admin_count} channel admins",
+            "Sent spam notifications to %s channel admins",
+            admin_count,
             extra={
                 "channel_id": message.sender_chat.id if message.sender_chat else None,
                 "total_admins": len(
@@ -5,6 +5,7 @@ This module handles channel-related operations including notifications
 to administrators when the bot is incorrectly added to channels.
 """
 
+import asyncio
 import contextlib
 import logging
 
@@ -129,7 +130,10 @@ def build_channel_instruction_userbot_message(
 
 
 async def notify_channel_admins(
-    chat: types.Chat, instruction: str, bot: Bot
+    chat: types.Chat,
+    instruction: str,
+    bot: Bot,
+    admins: list[types.ChatMember] | None = None,
 ) -> list[int]:
     """
     Notify all non-bot administrators of the channel.
@@ -138,6 +142,7 @@ async def notify_channel_admins(
         chat: The channel chat object
         instruction: The message to send to administrators
         bot: The bot instance for sending messages
+        admins: Administrators already fetched by the caller, if any
 
     Returns:
         List of admin IDs that were successfully notified
@@ -145,30 +150,32 @@ async def notify_channel_admins(
     notified_admins = []
 
     try:
-        admins = await bot.get_chat_administrators(chat.id)
+        if admins is None:
+            admins = await bot.get_chat_administrators(chat.id)
     except Exception as e:
         logger.warning(
             f"Failed to get channel admins for {chat.id}: {e}", exc_info=True
         )
         return notified_admins
 
-    for admin in admins:
-        if admin.user.is_bot:
-            continue
-
-        admin_id = admin.user.id
+    async def send_instruction(admin_id: int) -> bool:
         try:
 
             @retry_on_network_error
-            async def send_instruction() -> None:
+            async def send() -> None:
                 await bot.send_message(admin_id, instruction, parse_mode="HTML")
 
-            await send_instruction()
-            notified_admins.append(admin_id)
+            await send()
+            return True
         except Exception as e:
             logger.warning(
                 f"Failed to send instruction to admin {admin_id}: {e}", exc_info=True
             )
+            return False
+
+    admin_ids = [admin.user.id for admin in admins if not admin.user.is_bot]
+    sent = await asyncio.gather(*(send_instruction(a) for a in admin_ids))
+    notified_admins.extend(a for a, ok in zip(admin_ids, sent) if ok)
 
     return notified_admins
 
@@ -204,6 +211,7 @@ async def notify_channel_admins_and_leave(
     )
 
     lang = "en"
+    admins = None
     with contextlib.suppress(Exception):
         admins = await bot.get_chat_administrators(chat.id)
         for a in admins:
@@ -221,7 +229,7 @@ async def notify_channel_admins_and_leave(
     )
 
     try:
-        notified_admins = await notify_channel_admins(chat, instruction, bot)
+        notified_admins = await notify_channel_admins(chat, instruction, bot, admins)
         await bot.leave_chat(chat.id)
         logger.info(
             f"Bot left channel {chat.id} after notifying {len(notified_admins)} admins."
@@ -1,5 +1,6 @@
 """Message moderation pipeline: validation, spam analysis, result processing."""
 
+import asyncio
 import logging
 from typing import FrozenSet
 
@@ -84,8 +85,6 @@ async def handle_moderated_message(
             return "message_no_user_info"
 
         chat_id = message.chat.id
-        was_approved_before = await is_member_in_group(chat_id, user_id)
-
         group, exit_reason = await validate_group_and_check_early_exits(
             chat_id, user_id
         )
@@ -109,19 +108,26 @@ async def handle_moderated_message(
                     )
                 except Exception as e:
                     logger.warning(
-                        f"Failed to save message lookup for trusted user: {e}"
+                        "Failed to save message lookup for trusted user: %s", e
                     )
             return exit_reason
 
-        logger.debug(
-            f"sender_chat={getattr(message, 'sender_chat', None)}, "
-            f"chat.linked_chat_id={getattr(message.chat, 'linked_chat_id', None)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "sender_chat=%s, chat.linked_chat_id=%s",
+                getattr(message, "sender_chat", None),
+                getattr(message.chat, "linked_chat_id", None),
+            )
         skip, reason = await check_skip_channel_bot_message(message)
         if skip:
             return reason
 
-        message_context_result = await collect_message_context(message)
+        # The membership flag is only needed for probation bookkeeping; read it
+        # while context collection (Telegram/MTProto calls) is in flight
+        was_approved_before, message_context_result = await asyncio.gather(
+            is_member_in_group(chat_id, user_id),
+            collect_message_context(message),
+        )
 
         try:
             if message_context_result.is_story:
@@ -133,7 +139,7 @@ async def handle_moderated_message(
                     context=message_context_result.context,
                 )
         except Exception as e:
-            logger.warning(f"Failed to get spam classification: {e}")
+            logger.warning("Failed to get spam classification: %s", e)
             return "message_spam_check_failed"
 
         target_span = get_root_span()
@@ -159,7 +165,7 @@ async def handle_moderated_message(
                 account_signals_context=account_ctx,
             )
         except Exception as e:
-            logger.warning(f"Failed to save message lookup after classification: {e}")
+            logger.warning("Failed to save message lookup after classification: %s", e)
 
         result, member_inserted = await process_spam_or_approve(
             message,
@@ -176,7 +182,7 @@ async def handle_moderated_message(
         return result
 
     except Exception as e:
-        logger.error(f"Error processing message: {e}", exc_info=True)
+        logger.error("Error processing message: %s", e, exc_info=True)
         raise
 
 
@@ -7,7 +7,7 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from ..common.bot import bot
 from ..common.utils import retry_on_network_error
 from ..database import get_admin, record_successful_payment
-from ..i18n import resolve_lang, t
+from ..i18n import normalize_lang, resolve_lang, t
 from .dp import dp
 
 logger = logging.getLogger(__name__)
@@ -123,11 +123,10 @@ async def process_successful_payment(message: types.Message) -> str:
 
     admin_id = message.from_user.id
     stars_amount = message.successful_payment.total_amount
-    admin = await get_admin(admin_id)
-    lang = resolve_lang(message, admin)
 
     try:
-        await record_successful_payment(admin_id, stars_amount)
+        language_code = await record_successful_payment(admin_id, stars_amount)
+        lang = normalize_lang(language_code) if language_code else resolve_lang(message)
 
         success_text = t(lang, "payment.success_full", amount=stars_amount)
 
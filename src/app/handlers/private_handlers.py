@@ -4,11 +4,11 @@ import logging
 import pathlib
 from collections.abc import Coroutine
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, cast
+from functools import cache, lru_cache
+from typing import Any, Dict, List, Optional, Tuple, cast
 
-from aiogram import F, types
+from aiogram import types
 from aiogram.exceptions import TelegramBadRequest
-from aiogram.filters import or_f
 
 from ..common.bot import bot
 from ..spam.account_signals import build_account_signals_body
@@ -21,7 +21,14 @@ from ..agents import (
     _get_openrouter_chat_agents,
     _next_openrouter_chat_agent,
 )
-from ..common.utils import get_llm_route_timeout, sanitize_llm_html
+from ..common.ttl_cache import TTLCache
+from ..common.utils import (
+    get_llm_route_timeout,
+    html_to_plain_text,
+    load_config,
+    sanitize_llm_html,
+    split_html_message,
+)
 from ..database import (
     add_spam_example,
     find_message_by_text_and_user,
@@ -30,13 +37,15 @@ from ..database import (
     get_spam_examples,
     initialize_new_admin,
     remove_member_from_group,
-    save_message,
+    save_messages,
     update_admin_username_if_needed,
 )
-from ..database.group_operations import get_admin_groups
+from ..database.group_operations import get_admin_group_ids
 from ..i18n import normalize_lang, t
 from ..types import SpamClassificationContext
+from .callback_data import SpamExampleCallback
 from .dp import dp
+from .updates_filter import filter_private_forward, filter_private_message
 
 logger = logging.getLogger(__name__)
 
@@ -45,83 +54,83 @@ class OriginalMessageExtractionError(Exception):
     """Raised when original message information cannot be extracted"""
 
 
-def _resolve_admin_lang(admin: Any) -> str:
-    """Resolve admin language with fallback to English."""
-    return (
-        normalize_lang(admin.language_code) if admin and admin.language_code else "en"
-    )
+# Caps private chat LLM calls in flight so a burst of DMs queues here instead
+# of opening hundreds of concurrent model requests
+_chat_llm_semaphore = asyncio.Semaphore(
+    load_config().get("llm", {}).get("max_concurrent_chat_requests", 32)
+)
 
 
-def _premium_from_forward(msg: types.Message) -> Optional[bool]:
-    if msg.forward_from:
-        return getattr(msg.forward_from, "is_premium", None)
-    origin = msg.forward_origin
-    if isinstance(origin, types.MessageOriginUser):
-        return getattr(origin.sender_user, "is_premium", None)
-    return None
+@cache
+def _load_prd_text() -> str:
+    """Load PRD.md once; it is static for the lifetime of the process."""
+    try:
+        return pathlib.Path("PRD.md").read_text(encoding="utf-8")
+    except Exception:
+        return ""
 
 
-@dp.message(
-    F.chat.type == "private",
-    ~F.text.startswith("/"),
-    ~F.forward_from,
-    ~F.forward_origin,
-)
-async def handle_private_message(message: types.Message) -> str:
-    """Reply to user in private chat using LLM and message history context."""
-    if not message.from_user:
-        return "private_no_user_info"
+# Indexed by "is spam" (score > 0)
+_SCORE_LABELS = ("нет", "да")
 
-    user = cast("types.User", message.from_user)
-    admin_id = user.id
-    admin_message = message.text
 
-    if not admin_message:
-        return "private_no_message_text"
+def _format_prompt_example(example: Dict[str, Any]) -> str:
+    """Render one spam example for the private chat system prompt."""
+    parts = [
+        "<пример>\n<запрос>\n<текст сообщения>\n",
+        example["text"],
+        "\n</текст сообщения>",
+    ]
+    if "name" in example:
+        parts += ("\n<имя>", str(example["name"]), "</имя>")
+    if "bio" in example:
+        parts += ("\n<биография>", str(example["bio"]), "</биография>")
+    if example.get("linked_channel_fragment"):
+        parts += ("\n<канал>", example["linked_channel_fragment"], "</канал>")
+    # DB convention: score > 0 = spam, score < 0 = legitimate
+    score = example["score"]
+    parts += (
+        "\n</запрос>\n<ответ>\n",
+        f"{_SCORE_LABELS[score > 0]} {abs(score)}%",
+        "\n</ответ>\n</пример>",
+    )
+    return "".join(parts)
 
-    await initialize_new_admin(admin_id)
-    await update_admin_username_if_needed(admin_id, user.username)
 
-    # Save user message to history
-    await save_message(admin_id, "user", admin_message)
+# Last rendered examples block, paired with the (cached) list it was built from
+_examples_block_memo: Tuple[Optional[List[Dict[str, Any]]], str] = (None, "")
 
-    try:
-        # Get conversation history
-        message_history = await get_message_history(admin_id)
 
-        try:
-            prd_text = pathlib.Path("PRD.md").read_text()
-        except Exception:
-            prd_text = ""
-        spam_examples = await get_spam_examples()
-
-        # Format spam examples for prompt
-        formatted_examples = []
-        for example in spam_examples:
-            example_str = f"<пример>\n<запрос>\n<текст сообщения>\n{example['text']}\n</текст сообщения>"
-            if "name" in example:
-                example_str += f"\n<имя>{example['name']}</имя>"
-            if "bio" in example:
-                example_str += f"\n<биография>{example['bio']}</биография>"
-            if example.get("linked_channel_fragment"):
-                example_str += f"\n<канал>{example['linked_channel_fragment']}</канал>"
-            example_str += "\n</запрос>\n<ответ>\n"
-            # DB convention: score > 0 = spam, score < 0 = legitimate
-            example_str += f"{'да' if example['score'] > 0 else 'нет'} {abs(example['score'])}%\n</ответ>"
-            example_str += "\n</пример>"
-            formatted_examples.append(example_str)
-
-        system_prompt = f"""
+def _format_prompt_examples(spam_examples: List[Dict[str, Any]]) -> str:
+    """
+    Render the examples block, reusing the previous rendering while
+    get_spam_examples keeps returning the same cached list.
+    """
+    global _examples_block_memo
+    source, block = _examples_block_memo
+    if source is not spam_examples:
+        block = "\n".join(_format_prompt_example(example) for example in spam_examples)
+        _examples_block_memo = (spam_examples, block)
+    return block
+
+
+@cache
+def _system_prompt_prefix() -> str:
+    """Everything before the examples block; PRD.md is the only variable part."""
+    return f"""
 Ты - нейромодератор, киберсущность, защищающая пользователя от спама.
 
 <функционал и стиль ответа>
-{prd_text}
+{_load_prd_text()}
 </функционал и стиль ответа>
 
 А вот примеры того, что ты считаешь спамом, а что нет
 (is_spam=true — спам, is_spam=false — не спам):
 <примеры>
-{"\n".join(formatted_examples)}
+"""
+
+
+_SYSTEM_PROMPT_SUFFIX = """
 </примеры>
 
 Отвечай от имени бота и используй указанный стиль ответа.
@@ -153,15 +162,116 @@ async def handle_private_message(message: types.Message) -> str:
 </требования к форматированию>
 """
 
+
+@lru_cache(maxsize=1)
+def _build_system_prompt(examples_block: str) -> str:
+    """
+    Assemble the private chat system prompt.
+
+    Only the examples block changes between requests, so the prompt is the
+    constant prefix and suffix around it, memoised on the last block.
+    """
+    return _system_prompt_prefix() + examples_block + _SYSTEM_PROMPT_SUFFIX
+
+
+def warm_private_chat_prompt() -> None:
+    """Build the static prompt prefix (reads PRD.md) before the first DM arrives."""
+    _system_prompt_prefix()
+
+
+def _format_conversation(
+    message_history: List[Dict[str, Any]], admin_message: str
+) -> str:
+    """Render prior turns and the current message as one transcript, in one pass."""
+    history = "\n".join(
+        f"{msg['role'].upper()}: {msg['content']}" for msg in message_history
+    )
+    return f"{history}\n\nUSER: {admin_message}"
+
+
+async def _register_admin(admin_id: int, username: Optional[str]) -> None:
+    """Create the admin on first contact and keep the stored username current."""
+    await initialize_new_admin(admin_id)
+    await update_admin_username_if_needed(admin_id, username)
+
+
+def _is_html_parse_error(error: TelegramBadRequest) -> bool:
+    error_msg = str(error).lower()
+    return any(
+        error_text in error_msg
+        for error_text in (
+            "can't parse entities",
+            "can't find end tag",
+            "unclosed tag",
+        )
+    )
+
+
+async def _reply_in_chunks(message: types.Message, text: str) -> None:
+    """Reply with an LLM answer, split to fit Telegram's message length limit."""
+    first, *rest = split_html_message(text)
+    # Nothing has been sent yet: let the caller regenerate the answer
+    await message.reply(first, parse_mode="HTML")
+    for i, chunk in enumerate(rest):
+        try:
+            await message.answer(chunk, parse_mode="HTML")
+        except TelegramBadRequest as e:
+            if not _is_html_parse_error(e):
+                raise
+            # Earlier chunks are already delivered, so regenerating would
+            # repeat them; send only the remainder without markup instead
+            for remaining in rest[i:]:
+                await message.answer(html_to_plain_text(remaining))
+            return
+
+
+def _resolve_admin_lang(admin: Any) -> str:
+    """Resolve admin language with fallback to English."""
+    return (
+        normalize_lang(admin.language_code) if admin and admin.language_code else "en"
+    )
+
+
+def _premium_from_forward(msg: types.Message) -> Optional[bool]:
+    if msg.forward_from:
+        return getattr(msg.forward_from, "is_premium", None)
+    origin = msg.forward_origin
+    if isinstance(origin, types.MessageOriginUser):
+        return getattr(origin.sender_user, "is_premium", None)
+    return None
+
+
+@dp.message(filter_private_message)
+async def handle_private_message(message: types.Message) -> str:
+    """Reply to user in private chat using LLM and message history context."""
+    if not message.from_user:
+        return "private_no_user_info"
+
+    user = cast("types.User", message.from_user)
+    admin_id = user.id
+    admin_message = message.text
+
+    # Media-only and whitespace-only messages never reach the DB or the LLM
+    if not admin_message or admin_message.isspace():
+        return "private_no_message_text"
+
+    # Turns are buffered and written in one round trip when the handler exits,
+    # so the user's message is kept even when every provider fails
+    pending_turns = [("user", admin_message)]
+
+    try:
+        # Admin bookkeeping, history and examples are independent reads/writes
+        _, message_history, spam_examples = await asyncio.gather(
+            _register_admin(admin_id, user.username),
+            get_message_history(admin_id),
+            get_spam_examples(),
+        )
+        system_prompt = _build_system_prompt(_format_prompt_examples(spam_examples))
+
         # Build conversation for chat agent
         # pydantic-ai agent.run() takes a single user message string;
         # include history as part of the user message for context
-        conversation_parts = []
-        for msg in message_history:
-            role = msg["role"]
-            content = msg["content"]
-            conversation_parts.append(f"{role.upper()}: {content}")
-        user_message_text = "\n".join(conversation_parts) + f"\n\nUSER: {admin_message}"
+        user_message_text = _format_conversation(message_history, admin_message)
 
         # Get response from chat agent with retry logic for HTML parsing errors
         max_retries = 3
@@ -173,32 +283,26 @@ async def handle_private_message(message: types.Message) -> str:
         try:
             for retry_count in range(max_retries):
                 chat_agent = get_chat_agent()
-                result = await chat_agent.run(
-                    user_message_text,
-                    instructions=system_prompt,
-                    model_settings=model_settings,
-                )
+                async with _chat_llm_semaphore:
+                    result = await chat_agent.run(
+                        user_message_text,
+                        instructions=system_prompt,
+                        model_settings=model_settings,
+                    )
                 response = result.output
 
-                await save_message(admin_id, "assistant", response)
+                pending_turns.append(("assistant", response))
                 sanitized_response = sanitize_llm_html(response)
 
                 try:
-                    await message.reply(sanitized_response, parse_mode="HTML")
+                    await _reply_in_chunks(message, sanitized_response)
                     return "private_message_replied"
 
                 except TelegramBadRequest as send_error:
-                    error_msg = str(send_error).lower()
-                    is_html_error = any(
-                        error_text in error_msg
-                        for error_text in (
-                            "can't parse entities",
-                            "can't find end tag",
-                            "unclosed tag",
-                        )
-                    )
-
-                    if not is_html_error or retry_count >= max_retries - 1:
+                    if (
+                        not _is_html_parse_error(send_error)
+                        or retry_count >= max_retries - 1
+                    ):
                         raise send_error
 
                     # Retry with HTML correction
@@ -230,32 +334,26 @@ async def handle_private_message(message: types.Message) -> str:
 
             for retry_count in range(max_retries):
                 try:
-                    result = await chat_agent.run(
-                        user_message_text,
-                        instructions=system_prompt,
-                        model_settings=model_settings,
-                    )
+                    async with _chat_llm_semaphore:
+                        result = await chat_agent.run(
+                            user_message_text,
+                            instructions=system_prompt,
+                            model_settings=model_settings,
+                        )
                     response = result.output
 
-                    await save_message(admin_id, "assistant", response)
+                    pending_turns.append(("assistant", response))
                     sanitized_response = sanitize_llm_html(response)
 
                     try:
-                        await message.reply(sanitized_response, parse_mode="HTML")
+                        await _reply_in_chunks(message, sanitized_response)
                         return "private_message_replied"
 
                     except TelegramBadRequest as send_error:
-                        error_msg = str(send_error).lower()
-                        is_html_error = any(
-                            error_text in error_msg
-                            for error_text in (
-                                "can't parse entities",
-                                "can't find end tag",
-                                "unclosed tag",
-                            )
-                        )
-
-                        if not is_html_error or retry_count >= max_retries - 1:
+                        if (
+                            not _is_html_parse_error(send_error)
+                            or retry_count >= max_retries - 1
+                        ):
                             raise send_error
 
                         user_message_text = (
@@ -279,9 +377,11 @@ async def handle_private_message(message: types.Message) -> str:
     except Exception as e:
         logger.error(f"Error in private message handler: {e}", exc_info=True)
         raise
+    finally:
+        await save_messages(admin_id, pending_turns)
 
 
-@dp.message(F.chat.type == "private", or_f(F.forward_from, F.forward_origin))
+@dp.message(filter_private_forward)
 async def handle_forwarded_message(message: types.Message) -> str:
     """Prompt admin to confirm spam/not_spam for forwarded message."""
     if not message.from_user:
@@ -295,12 +395,12 @@ async def handle_forwarded_message(message: types.Message) -> str:
     row = [
         types.InlineKeyboardButton(
             text=t(lang, "private.spam_button"),
-            callback_data="spam_example:spam",
+            callback_data=SpamExampleCallback(action="spam").pack(),
             style="danger",
         ),
         types.InlineKeyboardButton(
             text=t(lang, "private.not_spam_button"),
-            callback_data="spam_example:not_spam",
+            callback_data=SpamExampleCallback(action="not_spam").pack(),
             style="success",
         ),
     ]
@@ -334,6 +434,13 @@ async def _load_channel_fragment(info: Dict[str, Any]) -> Optional[str]:
     return linked.get_fragment() if linked else None
 
 
+# Edited message label per language, indexed by is_spam
+_EXAMPLE_TYPE_LABELS = {
+    "en": ("valuable", "spam"),
+    "ru": ("ценного сообщения", "спама"),
+}
+
+
 def _resolve_example_texts(lang: str, is_spam: bool) -> tuple[str, str]:
     """Resolve callback answer and edited message label texts."""
     answer_text = (
@@ -341,11 +448,7 @@ def _resolve_example_texts(lang: str, is_spam: bool) -> tuple[str, str]:
         if is_spam
         else t(lang, "private.example_not_spam_added")
     )
-    edit_type = (
-        ("spam" if is_spam else "valuable")
-        if lang == "en"
-        else ("спама" if is_spam else "ценного сообщения")
-    )
+    edit_type = _EXAMPLE_TYPE_LABELS["en" if lang == "en" else "ru"][is_spam]
     return answer_text, edit_type
 
 
@@ -384,16 +487,17 @@ def _append_spam_cleanup_tasks(
     )
 
 
-@dp.callback_query(F.data.startswith("spam_example:"))
-async def process_spam_example_callback(callback: types.CallbackQuery) -> str:
+@dp.callback_query(SpamExampleCallback.filter())
+async def process_spam_example_callback(
+    callback: types.CallbackQuery, callback_data: SpamExampleCallback
+) -> str:
     """Handle spam/not_spam button press for forwarded message."""
     if not callback.from_user or not callback.data or not callback.message:
         return "spam_example_invalid_callback"
 
     user = cast("types.User", callback.from_user)
     admin_id = user.id
-    _, action = callback.data.split(":", maxsplit=1)
-    is_spam = action == "spam"
+    is_spam = callback_data.action == "spam"
 
     try:
         if not isinstance(callback.message, types.Message):
@@ -490,9 +594,22 @@ def _build_base_forwarded_info(original_message: types.Message) -> Dict[str, Any
     }
 
 
+# Admins often forward several messages from the same spammer; bios rarely change.
+# Values are wrapped in a 1-tuple so a cached "no bio" is not read as a miss.
+_bio_cache: TTLCache[Tuple[Optional[str]]] = TTLCache(
+    ttl=load_config().get("cache", {}).get("user_bio_ttl_seconds", 3600),
+    maxsize=10_000,
+)
+
+
 async def _safe_get_chat_bio(user_id: int) -> Optional[str]:
+    cached = _bio_cache.get(user_id)
+    if cached is not None:
+        return cached[0]
     user_info = await bot.get_chat(user_id)
-    return user_info.bio if user_info else None
+    bio = user_info.bio if user_info else None
+    _bio_cache.set(user_id, (bio,))
+    return bio
 
 
 async def _enrich_with_forward_metadata(
@@ -545,8 +662,7 @@ async def _fill_lookup_context_if_needed(
     if info["group_chat_id"] and info["group_message_id"]:
         return
 
-    admin_groups = await get_admin_groups(admin_id)
-    admin_group_ids = [group["id"] for group in admin_groups]
+    admin_group_ids = await get_admin_group_ids(admin_id)
     if not admin_group_ids:
         logger.info(
             "Admin has no managed groups, skipping message lookup",
@@ -12,6 +12,10 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from ..common.trace_context import get_root_span
 
 from ..common.bot import bot
+from ..common.chat_admins import (
+    get_chat_administrators_cached,
+    invalidate_chat_administrators,
+)
 from ..common.notifications import notify_admins_with_fallback_and_cleanup
 from ..common.utils import (
     format_chat_or_channel_display,
@@ -40,6 +44,13 @@ async def _resolve_lang(admin_ids: list[int] | None, fallback: str = "en") -> st
     return fallback
 
 
+def _human_admin_ids(admins: List[types.ChatMember]) -> List[int]:
+    """Unique non-bot admin IDs in API order (each admin gets one DM)."""
+    return list(
+        dict.fromkeys(admin.user.id for admin in admins if not admin.user.is_bot)
+    )
+
+
 @dp.my_chat_member()
 async def handle_bot_status_update(event: types.ChatMemberUpdated) -> str:
     """
@@ -61,6 +72,9 @@ async def handle_bot_status_update(event: types.ChatMemberUpdated) -> str:
             return "bot_blocked_private"
         return "bot_status_private_other"
 
+    # Our membership in the chat changed; don't trust an admin list fetched before
+    invalidate_chat_administrators(chat_id)
+
     try:
         if new_status == old_status:
             await _handle_permission_update(event, chat_id, admin_id, chat_title)
@@ -126,8 +140,8 @@ async def _handle_permission_update(
         if not has_all_rights:
             await set_no_rights_detected_at(chat_id)
             # Получаем список админов группы
-            admins = await bot.get_chat_administrators(chat_id)
-            admin_ids = [admin.user.id for admin in admins if not admin.user.is_bot]
+            admins = await get_chat_administrators_cached(bot, chat_id)
+            admin_ids = _human_admin_ids(admins)
             await _notify_admins_about_rights(
                 chat_id,
                 chat_title,
@@ -260,11 +274,12 @@ async def _handle_bot_removed(
     group = await get_group(chat_id)
     if group and group.admin_ids:
         # Filter out bots from admin list - only notify human admins
-        human_admin_ids = []
-        human_admin_ids.extend(
-            current_admin_id
-            for current_admin_id in group.admin_ids
-            if current_admin_id > 0
+        human_admin_ids = list(
+            dict.fromkeys(
+                current_admin_id
+                for current_admin_id in group.admin_ids
+                if current_admin_id > 0
+            )
         )
         if human_admin_ids:
             await _notify_admins_about_removal(
@@ -468,10 +483,8 @@ async def handle_member_service_message(message: types.Message) -> str:
                 await set_no_rights_detected_at(chat_id)
                 # Notify admins about missing permission - if this fails, cleanup will happen
                 try:
-                    admins = await bot.get_chat_administrators(chat_id)
-                    admin_ids = [
-                        admin.user.id for admin in admins if not admin.user.is_bot
-                    ]
+                    admins = await get_chat_administrators_cached(bot, chat_id)
+                    admin_ids = _human_admin_ids(admins)
                     lang = await _resolve_lang(admin_ids)
                     group_title = message.chat.title or ""
                     group_username = getattr(message.chat, "username", None)
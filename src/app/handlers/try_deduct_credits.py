@@ -8,18 +8,21 @@
 - Поиска администраторов с минимальным количеством кредитов
 """
 
+import asyncio
 import logging
-from typing import Optional, Sequence, Tuple, Union
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 from aiogram.types import ChatMember, ChatMemberAdministrator, ChatMemberOwner
 
 from ..common.bot import bot
+from ..common.chat_admins import get_chat_administrators_cached
 from ..common.utils import (
     format_chat_or_channel_display,
     get_add_to_group_url,
     retry_on_network_error,
 )
-from ..database import deduct_credits_from_admins, get_admin, set_group_moderation
+from ..database import deduct_credits_from_admins, get_admins_map
+from ..database.models import Administrator
 from ..i18n import normalize_lang, t
 
 logger = logging.getLogger(__name__)
@@ -40,52 +43,70 @@ async def try_deduct_credits(chat_id: int, amount: int, reason: str) -> bool:
     if amount == 0:
         return True
 
-    admin_id = await deduct_credits_from_admins(chat_id, amount)
+    admin_id = await deduct_credits_from_admins(
+        chat_id, amount, disable_on_failure=True
+    )
 
     if not admin_id:
-        logger.warning(f"No paying admins in chat {chat_id} for {reason}")
+        logger.warning("No paying admins in chat %s for %s", chat_id, reason)
         await handle_deactivation(chat_id)
         return False
 
     return True
 
 
+_HumanAdmin = Union[ChatMemberAdministrator, ChatMemberOwner]
+
+
+def _human_admins(admins: Sequence[ChatMember]) -> Tuple[_HumanAdmin, ...]:
+    """Администраторы и владельцы, не являющиеся ботами, в порядке API."""
+    return tuple(
+        admin
+        for admin in admins
+        if isinstance(admin, (ChatMemberAdministrator, ChatMemberOwner))
+        and not admin.user.is_bot
+    )
+
+
 async def handle_deactivation(chat_id: int) -> None:
     """
-    Обрабатывает деактивацию группы.
+    Обрабатывает деактивацию группы (модерация уже отключена при списании).
 
     Args:
         chat_id: ID чата
     """
-    await set_group_moderation(chat_id, False)
     chat = await bot.get_chat(chat_id)
     if not chat.title:
-        logger.warning(f"Failed to get chat title for {chat_id}")
+        logger.warning("Failed to get chat title for %s", chat_id)
         return
 
-    admins = await bot.get_chat_administrators(chat_id)
-    min_credits_admin, min_credits = await find_min_credits_admin(admins)
+    # Filter once; the helpers below get only human admins
+    admins = _human_admins(await get_chat_administrators_cached(bot, chat_id))
+    admins_map = await get_admins_map([admin.user.id for admin in admins])
+    min_credits_admin, min_credits = find_min_credits_admin(admins, admins_map)
 
     if min_credits_admin:
         bot_info = await bot.me()
         ref_link = f"https://t.me/{bot_info.username}?start={min_credits_admin.user.id}"
 
         await send_group_deactivation_message(
-            chat_id, ref_link, min_credits_admin, min_credits
+            chat_id, ref_link, min_credits_admin, min_credits, admins_map
         )
         await notify_admins_about_deactivation(
-            admins, chat.title, ref_link, getattr(chat, "username", None)
+            admins, chat.title, ref_link, admins_map, getattr(chat, "username", None)
         )
 
 
-async def find_min_credits_admin(
+def find_min_credits_admin(
     admins: Sequence[ChatMember],
+    admins_map: Dict[int, Administrator],
 ) -> Tuple[Optional[Union[ChatMemberAdministrator, ChatMemberOwner]], float]:
     """
     Находит администратора с наименьшим количеством звезд.
 
     Args:
         admins: Список администраторов
+        admins_map: Записи администраторов из БД по ID
 
     Returns:
         Tuple[Optional[Union[ChatMemberAdministrator, ChatMemberOwner]], float]:
@@ -94,12 +115,8 @@ async def find_min_credits_admin(
     min_credits_admin = None
     min_credits = float("inf")
 
-    for admin in admins:
-        if not isinstance(admin, (ChatMemberAdministrator, ChatMemberOwner)):
-            continue
-        if admin.user.is_bot:
-            continue
-        admin_data = await get_admin(admin.user.id)
+    for admin in _human_admins(admins):
+        admin_data = admins_map.get(admin.user.id)
         if admin_data and admin_data.credits < min_credits:
             min_credits = admin_data.credits
             min_credits_admin = admin
@@ -112,6 +129,7 @@ async def send_group_deactivation_message(
     ref_link: str,
     min_credits_admin: Union[ChatMemberAdministrator, ChatMemberOwner],
     min_credits: float,
+    admins_map: Dict[int, Administrator],
 ) -> None:
     """
     Отправляет сообщение о деактивации в группу.
@@ -121,8 +139,9 @@ async def send_group_deactivation_message(
         ref_link: Реферальная ссылка
         min_credits_admin: Админ с минимальным балансом
         min_credits: Минимальный баланс
+        admins_map: Записи администраторов из БД по ID
     """
-    first_admin = await get_admin(min_credits_admin.user.id)
+    first_admin = admins_map.get(min_credits_admin.user.id)
     lang = (
         normalize_lang(first_admin.language_code)
         if first_admin and first_admin.language_code
@@ -148,13 +167,14 @@ async def send_group_deactivation_message(
         await send_deactivation_message()
 
     except Exception as e:
-        logger.warning(f"Failed to send group promo message: {e}", exc_info=True)
+        logger.warning("Failed to send group promo message: %s", e, exc_info=True)
 
 
 async def notify_admins_about_deactivation(
     admins: Sequence[ChatMember],
     chat_title: str,
     ref_link: str,
+    admins_map: Dict[int, Administrator],
     chat_username: Optional[str] = None,
 ) -> None:
     """
@@ -164,20 +184,14 @@ async def notify_admins_about_deactivation(
         admins: Список администраторов
         chat_title: Название чата
         ref_link: Реферальная ссылка
+        admins_map: Записи администраторов из БД по ID
         chat_username: Опциональный username группы без @
     """
-    first_admin_id = next(
-        (
-            a.user.id
-            for a in admins
-            if isinstance(a, (ChatMemberAdministrator, ChatMemberOwner))
-            and not a.user.is_bot
-        ),
-        None,
-    )
+    admins = _human_admins(admins)
+    first_admin_id = admins[0].user.id if admins else None
     lang = "en"
     if first_admin_id:
-        first_admin = await get_admin(first_admin_id)
+        first_admin = admins_map.get(first_admin_id)
         lang = (
             normalize_lang(first_admin.language_code)
             if first_admin and first_admin.language_code
@@ -187,22 +201,8 @@ async def notify_admins_about_deactivation(
     group_display = format_chat_or_channel_display(
         chat_title, chat_username, t(lang, "common.group")
     )
-    for admin in admins:
-        if not isinstance(admin, (ChatMemberAdministrator, ChatMemberOwner)):
-            continue
-        if admin.user.is_bot:
-            continue
-
-        admin_id = admin.user.id
-        admin_obj = await get_admin(admin_id)
-        admin_lang = (
-            normalize_lang(admin_obj.language_code)
-            if admin_obj and admin_obj.language_code
-            else lang
-        )
-        message_text = t(admin_lang, "deactivate.admin_message", group=group_display)
-        message_text += t(admin_lang, "deactivate.admin_invite", ref_link=ref_link)
 
+    async def notify_admin(admin_id: int, message_text: str) -> None:
         try:
 
             @retry_on_network_error
@@ -216,4 +216,20 @@ async def notify_admins_about_deactivation(
 
             await send_notification()
         except Exception as e:
-            logger.warning(f"Failed to notify admin {admin_id}: {e}", exc_info=True)
+            logger.warning("Failed to notify admin %s: %s", admin_id, e, exc_info=True)
+
+    # Independent DMs: send them concurrently rather than one round trip at a time
+    notifications = []
+    for admin in admins:
+        admin_id = admin.user.id
+        admin_obj = admins_map.get(admin_id)
+        admin_lang = (
+            normalize_lang(admin_obj.language_code)
+            if admin_obj and admin_obj.language_code
+            else lang
+        )
+        message_text = t(admin_lang, "deactivate.admin_message", group=group_display)
+        message_text += t(admin_lang, "deactivate.admin_invite", ref_link=ref_link)
+        notifications.append(notify_admin(admin_id, message_text))
+
+    await asyncio.gather(*notifications)
@@ -1,73 +1,109 @@
-from aiogram import F
-from aiogram.filters import and_f, or_f
-
-# Фильтр для передачи сообщения в handle_message:
-# 1. Только для групп и супергрупп
-# 2. Только если отправитель не админ
-# 3. Сообщение не отредактировано
-# 4. Не сервисное сообщение (новые участники, смена фото и т.д.)
-# 5. Сообщение содержит текст или медиа
-# 6. Ответы не ограничиваем — дальнейшая фильтрация выполняется в
-#    check_skip_channel_bot_message
-
-filter_handle_message = and_f(
-    # 1. Только групповые чаты
-    F.chat.type.in_(["group", "supergroup"]),
-    # 2. Не админ
-    ~F.from_user.is_admin,
-    # 3. Не отредактированное сообщение
-    ~F.edited_message,
-    # 4. Не сервисные сообщения
-    ~F.new_chat_member,
-    ~F.new_chat_members,
-    ~F.left_chat_member,
-    ~F.new_chat_title,
-    ~F.new_chat_photo,
-    ~F.delete_chat_photo,
-    ~F.group_chat_created,
-    ~F.supergroup_chat_created,
-    ~F.channel_chat_created,
-    ~F.message_auto_delete_timer_changed,
-    ~F.pinned_message,
-    # 5. Содержит текст или медиа
-    or_f(
-        F.text,
-        F.photo,
-        F.video,
-        F.document,
-        F.sticker,
-        F.voice,
-        F.video_note,
-        F.animation,
-        F.audio,
-        F.story,
-    ),
+from aiogram import types
+from aiogram.filters import Filter
+
+# Групповые фильтры — тоже Filter-классы, а не цепочки and_f/or_f из F:
+# ~25 магических листьев на каждое сообщение группы раньше вычислялись в
+# потоке через asyncio.to_thread. Отсутствующий атрибут, как и у F, считается
+# пустым значением.
+
+_GROUP_CHAT_TYPES = frozenset({"group", "supergroup"})
+
+# Сервисные сообщения (новые участники, смена фото и т.д.)
+_SERVICE_FIELDS = (
+    "new_chat_member",
+    "new_chat_members",
+    "left_chat_member",
+    "new_chat_title",
+    "new_chat_photo",
+    "delete_chat_photo",
+    "group_chat_created",
+    "supergroup_chat_created",
+    "channel_chat_created",
+    "message_auto_delete_timer_changed",
+    "pinned_message",
 )
 
-# Edited messages in groups: same content rules as new messages; admin check is in validation
-filter_handle_edited_message = and_f(
-    F.chat.type.in_(["group", "supergroup"]),
-    ~F.new_chat_member,
-    ~F.new_chat_members,
-    ~F.left_chat_member,
-    ~F.new_chat_title,
-    ~F.new_chat_photo,
-    ~F.delete_chat_photo,
-    ~F.group_chat_created,
-    ~F.supergroup_chat_created,
-    ~F.channel_chat_created,
-    ~F.message_auto_delete_timer_changed,
-    ~F.pinned_message,
-    or_f(
-        F.text,
-        F.photo,
-        F.video,
-        F.document,
-        F.sticker,
-        F.voice,
-        F.video_note,
-        F.animation,
-        F.audio,
-        F.story,
-    ),
+# Текст или медиа
+_CONTENT_FIELDS = (
+    "text",
+    "photo",
+    "video",
+    "document",
+    "sticker",
+    "voice",
+    "video_note",
+    "animation",
+    "audio",
+    "story",
 )
+
+
+def _is_group_content_message(message: types.Message) -> bool:
+    """Group message with text or media that is not a service message."""
+    if message.chat.type not in _GROUP_CHAT_TYPES:
+        return False
+    if any(getattr(message, field, None) for field in _SERVICE_FIELDS):
+        return False
+    return any(getattr(message, field, None) for field in _CONTENT_FIELDS)
+
+
+class GroupMessageFilter(Filter):
+    """
+    Фильтр для передачи сообщения в handle_message:
+    1. Только для групп и супергрупп
+    2. Только если отправитель не админ
+    3. Сообщение не отредактировано
+    4. Не сервисное сообщение (новые участники, смена фото и т.д.)
+    5. Сообщение содержит текст или медиа
+    6. Ответы не ограничиваем — дальнейшая фильтрация выполняется в
+       check_skip_channel_bot_message
+    """
+
+    async def __call__(self, message: types.Message) -> bool:
+        if message.chat.type not in _GROUP_CHAT_TYPES:
+            return False
+        if getattr(message.from_user, "is_admin", None):
+            return False
+        if getattr(message, "edited_message", None):
+            return False
+        return _is_group_content_message(message)
+
+
+class GroupEditedMessageFilter(Filter):
+    """Edited messages in groups: same content rules as new messages; admin check is in validation."""
+
+    async def __call__(self, message: types.Message) -> bool:
+        return _is_group_content_message(message)
+
+
+filter_handle_message = GroupMessageFilter()
+filter_handle_edited_message = GroupEditedMessageFilter()
+
+
+# Фильтры личных сообщений. Это обычные Filter-классы, а не цепочки F: aiogram
+# вызывает синхронный resolve магических фильтров через asyncio.to_thread, а
+# корутина __call__ проверяется прямо в event loop, самая дешёвая проверка первой.
+
+
+class PrivateMessageFilter(Filter):
+    """Private chat message that is neither a command nor a forward."""
+
+    async def __call__(self, message: types.Message) -> bool:
+        if message.chat.type != "private":
+            return False
+        if message.forward_from or message.forward_origin:
+            return False
+        return not (message.text and message.text.startswith("/"))
+
+
+class PrivateForwardFilter(Filter):
+    """Message forwarded into a private chat with the bot."""
+
+    async def __call__(self, message: types.Message) -> bool:
+        return message.chat.type == "private" and bool(
+            message.forward_from or message.forward_origin
+        )
+
+
+filter_private_message = PrivateMessageFilter()
+filter_private_forward = PrivateForwardFilter()
@@ -16,6 +16,7 @@ logger = logging.getLogger(__name__)
 _SUPPORTED = {"ru", "en"}
 _DEFAULT_LANG = "en"
 _LOCALES: dict[str, dict[str, Any]] = {}
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # Inline help-section callback_data — same strings as t() keys (≤64 bytes for Telegram).
 HELP_PAGE_CALLBACK_KEYS: frozenset[str] = frozenset(
@@ -43,7 +44,7 @@ def load_locales() -> None:
         if path.exists():
             try:
                 with open(path, "r", encoding="utf-8") as f:
-                    _LOCALES[lang] = yaml.safe_load(f) or {}
+                    _LOCALES[lang] = yaml.load(f, Loader=_YAML_LOADER) or {}
             except Exception as e:
                 logger.warning(f"Failed to load locale {lang}: {e}")
                 _LOCALES[lang] = {}
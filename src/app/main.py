@@ -23,15 +23,21 @@ from aiohttp import web
 # Import all handlers to register them with the dispatcher
 from .handlers import *
 
+from .agents import close_llm_http_clients
 from .background_jobs import scheduled_jobs_loop
 from .bot_commands import setup_bot_commands
+from .common import fast_json
 from .common.bot import bot
 from .common.trace_context import set_root_span
 from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
 from .common.mcp_client import close_mcp_http_client
-from .common.utils import get_dotted_path, get_webhook_timeout, validate_llm_config
-from .database.postgres_connection import close_pool
+from .common.mtproto_client import close_mtproto_http_client
+from .common.utils import get_webhook_timeout, validate_llm_config
+from .database.group_operations import moderation_events_queue
+from .database.message_lookup import lookup_write_queue
+from .database.postgres_connection import close_pool, get_pool
 from .handlers.dp import dp
+from .handlers.private_handlers import warm_private_chat_prompt
 from .logging_setup import get_telegram_handler, register_telegram_logging_loop
 
 routes = web.RouteTableDef()
@@ -53,10 +59,12 @@ async def healthcheck(_: web.Request) -> web.Response:
 @routes.post("/process-tg-updates")
 async def handle_update(request: web.Request) -> web.Response:
     """Handle incoming Telegram update"""
-    if not await request.read():
+    body = await request.read()
+    if not body:
         return web.Response()
 
-    json = await request.json()
+    # Parse the raw bytes directly: request.json() would decode them to str first
+    json = fast_json.loads(body)
 
     # Validate that this is a proper Telegram update
     if not isinstance(json, dict) or "update_id" not in json:
@@ -98,9 +106,8 @@ async def handle_update(request: web.Request) -> web.Response:
             return await handle_unhandled_exception(span, e, json)
 
         finally:
-            if update_time := get_dotted_path(json, "*.edit_date") or get_dotted_path(
-                json, "*.date"
-            ):
+            payload = _update_payload(json)
+            if update_time := payload.get("edit_date") or payload.get("date"):
                 serve_time = time.time() - update_time
                 span.set_attribute("serve_time", serve_time)
                 serve_time_histogram.record(serve_time)
@@ -120,17 +127,27 @@ def extract_update_type_ignored(json: dict) -> str:
         return "multiple_types_ignored"
 
 
+def _update_payload(json: dict) -> dict:
+    """Return the update's payload object (message, callback_query, ...)."""
+    # A Telegram update carries update_id plus exactly one payload key
+    for key, value in json.items():
+        if key != "update_id" and isinstance(value, dict):
+            return value
+    return {}
+
+
 def extract_chat_or_user(json: dict) -> str:
-    # Extract message title or username from the update
-    for path in [
-        "*.chat.title",
-        "*.from.username",
-        "*.from.first_name",
-    ]:
-        try:
-            return f"{get_dotted_path(json, path, True)}"
-        except Exception:
-            continue
+    # Extract message title or username from the update with direct lookups;
+    # no per-miss KeyError that formats the whole update
+    payload = _update_payload(json)
+    chat = payload.get("chat")
+    if isinstance(chat, dict) and "title" in chat:
+        return f"{chat['title']}"
+    sender = payload.get("from")
+    if isinstance(sender, dict):
+        for key in ("username", "first_name"):
+            if key in sender:
+                return f"{sender[key]}"
 
     return "Unknown chat or user"
 
@@ -171,6 +188,23 @@ async def _on_startup_scheduled_jobs(app: web.Application) -> None:
     logger.info("Scheduled jobs loop started")
 
 
+async def _on_startup_write_behind(app: web.Application) -> None:
+    """Start background flushing of off-critical-path DB writes."""
+    lookup_write_queue.start()
+    moderation_events_queue.start()
+
+
+async def _on_startup_warm_caches(app: web.Application) -> None:
+    """Do one-off prompt and pool work at boot instead of on the first update."""
+    warm_private_chat_prompt()
+    try:
+        await get_pool()
+    except Exception as e:
+        # A brief DB outage must not crash-loop the bot: the pool is still
+        # created lazily by the first update that needs it
+        logger.warning(f"Could not pre-create DB pool at startup: {e}", exc_info=True)
+
+
 async def _on_startup_log_server_started(app: web.Application) -> None:
     logging.warning("Server started")
 
@@ -185,6 +219,13 @@ async def _shutdown(app: web.Application) -> None:
         with contextlib.suppress(asyncio.CancelledError):
             await _scheduled_jobs_task
 
+    # Flush buffered lookup entries and counters while the pool is still open
+    for queue in (lookup_write_queue, moderation_events_queue):
+        try:
+            await queue.stop()
+        except Exception as e:
+            logger.warning(f"Error flushing write-behind queue: {e}", exc_info=True)
+
     # Stop TelegramLogHandler before closing the bot session,
     # so that queued messages can still be sent before the connector is closed.
     if telegram_handler := get_telegram_handler():
@@ -197,11 +238,15 @@ async def _shutdown(app: web.Application) -> None:
         tg.create_task(bot.session.close())
         tg.create_task(close_pool())
         tg.create_task(close_mcp_http_client())
+        tg.create_task(close_mtproto_http_client())
+        tg.create_task(close_llm_http_clients())
 
 
 app.on_startup.append(_on_startup_validate_config)
 app.on_startup.append(_on_startup_setup_bot)
 app.on_startup.append(_on_startup_scheduled_jobs)
+app.on_startup.append(_on_startup_write_behind)
+app.on_startup.append(_on_startup_warm_caches)
 app.on_startup.append(_on_startup_log_server_started)
 app.on_shutdown.append(_shutdown)
 
@@ -283,5 +328,14 @@ async def handle_unhandled_exception(
     return web.json_response({"message": "Error processing request"})
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Use uvloop when it is installed; fall back to the stock asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
 if __name__ == "__main__":
-    web.run_app(app, host="0.0.0.0", port=8080)
+    web.run_app(app, host="0.0.0.0", port=8080, loop=_new_event_loop())
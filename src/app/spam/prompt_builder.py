@@ -18,12 +18,14 @@ Prompt Structure:
 4. Spam classification examples from database
 """
 
-import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import logfire
 
+from ..common import fast_json
+from ..common.ttl_cache import TTLCache
+from ..common.utils import load_config
 from ..database.spam_examples import get_spam_examples
 from ..i18n import t
 from ..types import ContextResult, SpamClassificationContext
@@ -31,6 +33,13 @@ from .account_signals import build_account_signals_body
 
 logger = logging.getLogger(__name__)
 
+# Rendered few-shot JSON keyed on id() of the cached example list it came from;
+# the list itself is kept in the entry, so a stale id can never match.
+_examples_json_cache: TTLCache[Tuple[List[Dict[str, Any]], str]] = TTLCache(
+    ttl=load_config().get("cache", {}).get("spam_examples_ttl_seconds", 30),
+    maxsize=256,
+)
+
 
 def _norm_opt(value: Any) -> Optional[str]:
     """Coerce value to stripped string, or None if empty."""
@@ -61,6 +70,28 @@ def format_spam_example_input(example: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _render_examples_json(db_examples: List[Dict[str, Any]]) -> str:
+    """Serialize DB examples as few-shot JSON, once per cached example list."""
+    cached = _examples_json_cache.get(id(db_examples))
+    if cached is not None and cached[0] is db_examples:
+        return cached[1]
+
+    examples_list = [
+        {
+            "input": format_spam_example_input(example),
+            "label": {
+                "is_spam": example["score"] > 0,
+                "confidence": abs(example["score"]),
+            },
+        }
+        for example in db_examples
+    ]
+
+    examples_json = fast_json.dumps({"examples": examples_list})
+    _examples_json_cache.set(id(db_examples), (db_examples, examples_json))
+    return examples_json
+
+
 @logfire.no_auto_trace
 class SpamPromptBuilder:
     """Builder for spam classification prompts."""
@@ -268,23 +299,7 @@ Confidence calibration policy: use medium confidence for ambiguous cases with mi
         """Add spam examples from the database as unified JSON."""
         try:
             db_examples = await get_spam_examples(admin_ids)
-
-            examples_list = []
-            for example in db_examples:
-                is_spam_ex = example["score"] > 0
-                confidence_ex = abs(example["score"])
-                examples_list.append(
-                    {
-                        "input": format_spam_example_input(example),
-                        "label": {"is_spam": is_spam_ex, "confidence": confidence_ex},
-                    }
-                )
-
-            examples_json = json.dumps(
-                {"examples": examples_list},
-                ensure_ascii=False,
-                separators=(",", ":"),
-            )
+            examples_json = _render_examples_json(db_examples)
             self.prompt_parts.append(examples_json)
         except Exception as e:
             logger.warning(f"Failed to load spam examples for prompt: {e}")
@@ -413,4 +428,4 @@ def format_spam_request(
         "account_signals": account_signals_str,
     }
 
-    return json.dumps(request_dict, ensure_ascii=False, separators=(",", ":"))
+    return fast_json.dumps(request_dict)
@@ -1,7 +1,9 @@
 """Spam classification: prompt building, LLM calls, response parsing."""
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import logfire
 
@@ -13,7 +15,8 @@ from ..agents import (
     _get_openrouter_agents,
     _next_openrouter_agent,
 )
-from ..common.utils import get_llm_route_timeout
+from ..common.ttl_cache import TTLCache
+from ..common.utils import get_llm_route_timeout, load_config
 from ..database import get_admin
 from ..i18n import normalize_lang
 from ..types import SpamClassificationContext
@@ -24,6 +27,23 @@ attempts_histogram = logfire.metric_histogram("attempts")
 
 logger = logging.getLogger(__name__)
 
+# Copy-paste spam recurs across groups within minutes. The key covers the full
+# system prompt (examples, admin language) and the request, so a hit means the
+# LLM would have been called with byte-identical input.
+_classification_cache: TTLCache[Tuple[bool, int, str]] = TTLCache(
+    ttl=load_config().get("cache", {}).get("classification_ttl_seconds", 3600),
+    maxsize=4096,
+)
+
+
+_inflight_classifications: Dict[bytes, "asyncio.Future[Tuple[bool, int, str]]"] = {}
+
+
+def _classification_cache_key(system_prompt: str, user_message: str) -> bytes:
+    return hashlib.sha1(
+        f"{system_prompt}\0{user_message}".encode("utf-8", "surrogatepass")
+    ).digest()
+
 
 async def is_spam(
     comment: str,
@@ -50,6 +70,33 @@ async def is_spam(
         "Analyze this message and respond with JSON spam classification "
         "including is_spam, confidence, and reason."
     )
+    cache_key = _classification_cache_key(system_prompt, user_message)
+    cached = _classification_cache.get(cache_key)
+    if cached is not None:
+        logfire.info("spam_classifier_cache_hit")
+        return cached
+
+    # A burst of the same spam arrives before the first verdict is cached;
+    # concurrent identical requests share one LLM call
+    inflight = _inflight_classifications.get(cache_key)
+    if inflight is None:
+        inflight = asyncio.ensure_future(
+            _classify_with_llm(cache_key, system_prompt, user_message)
+        )
+        _inflight_classifications[cache_key] = inflight
+        inflight.add_done_callback(
+            lambda _: _inflight_classifications.pop(cache_key, None)
+        )
+    else:
+        logfire.info("spam_classifier_inflight_hit")
+    # Shielded so one cancelled caller does not cancel the call for the others
+    return await asyncio.shield(inflight)
+
+
+async def _classify_with_llm(
+    cache_key: bytes, system_prompt: str, user_message: str
+) -> Tuple[bool, int, str]:
+    """Gateway first, then the OpenRouter pool; caches the verdict."""
     llm_timeout = get_llm_route_timeout()
     model_settings = ModelSettings(timeout=llm_timeout)
 
@@ -69,6 +116,9 @@ async def is_spam(
             confidence_result if is_spam_result else -confidence_result
         )
         attempts_histogram.record(1)
+        _classification_cache.set(
+            cache_key, (is_spam_result, confidence_result, reason_result)
+        )
         return is_spam_result, confidence_result, reason_result
 
     except Exception as e:
@@ -98,6 +148,9 @@ async def is_spam(
                     confidence_result if is_spam_result else -confidence_result
                 )
                 attempts_histogram.record(attempt + 1)
+                _classification_cache.set(
+                    cache_key, (is_spam_result, confidence_result, reason_result)
+                )
                 return is_spam_result, confidence_result, reason_result
             except Exception as e:
                 logger.warning(
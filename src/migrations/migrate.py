@@ -523,6 +523,50 @@ async def add_no_rights_column_migration(conn: Any) -> List[str]:
     return operations
 
 
+async def add_payment_function_migration(conn: Any) -> List[str]:
+    """
+    Create apply_successful_payment(), which returns the payer's language_code,
+    and turn process_successful_payment into a wrapper around it. Run before
+    deploying code that calls the function.
+    """
+    operations = []
+    print("Starting payment function migration...")
+
+    async with conn.transaction():
+        await create_procedures(conn)
+        operations.append("Created apply_successful_payment function")
+        print("✓ Created apply_successful_payment function")
+
+    print(
+        f"Payment function migration completed successfully. {len(operations)} operations performed."
+    )
+    return operations
+
+
+async def add_group_admins_admin_index_migration(conn: Any) -> List[str]:
+    """
+    Index group_administrators by admin_id. The primary key leads with
+    group_id, so per-admin reads (admin's groups, payment re-enable) scanned it.
+    """
+    operations = []
+    print("Starting group administrators index migration...")
+
+    async with conn.transaction():
+        await conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_group_administrators_admin
+                ON group_administrators (admin_id, group_id)
+            """
+        )
+        operations.append("Created idx_group_administrators_admin")
+        print("✓ Created idx_group_administrators_admin")
+
+    print(
+        f"Group administrators index migration completed successfully. {len(operations)} operations performed."
+    )
+    return operations
+
+
 async def run_context_columns_migration():
     """Run the context columns migration manually."""
     print("Creating database if it doesn't exist...")
@@ -795,6 +839,30 @@ async def run_pending_spam_example_migration():
         await add_pending_spam_example_columns_migration(conn)
 
 
+async def run_payment_function_migration():
+    """Run the payment function migration manually."""
+    print("Creating database if it doesn't exist...")
+    await create_database()
+    print("Getting database pool...")
+    pool = await get_pool()
+    print("Running payment function migration...")
+    async with pool.acquire() as conn:
+        print("Acquired connection from pool")
+        await add_payment_function_migration(conn)
+
+
+async def run_group_admins_admin_index_migration():
+    """Run the group administrators index migration manually."""
+    print("Creating database if it doesn't exist...")
+    await create_database()
+    print("Getting database pool...")
+    pool = await get_pool()
+    print("Running group administrators index migration...")
+    async with pool.acquire() as conn:
+        print("Acquired connection from pool")
+        await add_group_admins_admin_index_migration(conn)
+
+
 async def main():
     if len(sys.argv) > 1:
         if sys.argv[1] == "--add-context-columns":
@@ -823,6 +891,10 @@ async def main():
             await run_moderation_mode_migration()
         elif sys.argv[1] == "--drop-delete-spam":
             await run_drop_delete_spam_migration()
+        elif sys.argv[1] == "--add-payment-function":
+            await run_payment_function_migration()
+        elif sys.argv[1] == "--add-group-admins-index":
+            await run_group_admins_admin_index_migration()
         else:
             raise ValueError(f"Unknown migration flag {sys.argv[1]!r}")
     else:
@@ -130,7 +130,8 @@ async def test_leave_sole_payer_groups_leaves_and_notifies():
             new_callable=AsyncMock,
         ) as mock_get_groups,
         patch(
-            "app.background_jobs.low_balance.get_paying_admins", new_callable=AsyncMock
+            "app.background_jobs.low_balance.get_groups_with_paying_admins",
+            new_callable=AsyncMock,
         ) as mock_paying,
         patch("app.background_jobs.low_balance.load_config") as mock_load,
         patch(
@@ -147,10 +148,7 @@ async def test_leave_sole_payer_groups_leaves_and_notifies():
         ) as mock_send,
     ):
         mock_get_groups.return_value = [100, 200]
-        mock_paying.side_effect = [
-            [],
-            [333],
-        ]  # group 100: no payers, group 200: admin 333 pays
+        mock_paying.return_value = {200}  # group 100: no payers, group 200 has one
         mock_load.return_value = {"system": {"project_website": "https://test.ru"}}
         mock_get_admin.return_value = type(
             "Admin", (), {"is_active": True, "language_code": "ru"}
@@ -0,0 +1,27 @@
+"""Tests for the chat administrators cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.app.common.chat_admins import (
+    _admins_cache,
+    get_chat_administrators_cached,
+    invalidate_chat_administrators,
+)
+
+
+@pytest.mark.asyncio
+async def test_admins_fetched_once_until_invalidated():
+    _admins_cache.clear()
+    bot = MagicMock()
+    bot.get_chat_administrators = AsyncMock(return_value=[MagicMock()])
+
+    first = await get_chat_administrators_cached(bot, -100)
+    assert await get_chat_administrators_cached(bot, -100) is first
+    bot.get_chat_administrators.assert_awaited_once_with(-100)
+
+    invalidate_chat_administrators(-100)
+    await get_chat_administrators_cached(bot, -100)
+    assert bot.get_chat_administrators.await_count == 2
+    _admins_cache.clear()
@@ -0,0 +1,19 @@
+"""Tests for the JSON helpers used on hot paths."""
+
+import json
+
+from app.common import fast_json
+
+
+def test_dumps_is_compact_and_keeps_unicode():
+    payload = {"message": "Привет 👋", "user_bio": None, "n": [1, 2]}
+
+    dumped = fast_json.dumps(payload)
+
+    assert dumped == '{"message":"Привет 👋","user_bio":null,"n":[1,2]}'
+    assert json.loads(dumped) == payload
+
+
+def test_loads_accepts_bytes_and_text():
+    assert fast_json.loads(b'{"update_id": 1}') == {"update_id": 1}
+    assert fast_json.loads('{"update_id": 1}') == {"update_id": 1}
@@ -0,0 +1,20 @@
+"""Tests for MTProto bridge HTTP session reuse."""
+
+import pytest
+
+from app.common.mtproto_client import MtprotoHttpClient
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_until_closed():
+    client = MtprotoHttpClient("https://bridge.invalid", "token")
+
+    first = await client._ensure_session()
+    assert await client._ensure_session() is first
+
+    await client.aclose()
+    assert first.closed
+
+    second = await client._ensure_session()
+    assert second is not first
+    await client.aclose()
@@ -98,3 +98,37 @@ class TestNotifyAdminsWithCleanup:
 
             # Should return no cleanup result
             assert result["group_cleaned_up"] is False
+
+    @pytest.mark.asyncio
+    async def test_admins_notified_concurrently_in_order(self, mock_bot):
+        """Private sends overlap, and results keep the admin_ids order."""
+        import asyncio
+
+        admin_ids = [111, 222, 333]
+        in_flight = 0
+        peak = 0
+
+        async def send_message(chat_id, *args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 if chat_id == 111 else 0)
+            in_flight -= 1
+            if chat_id == 222:
+                raise Exception("blocked")
+            return MagicMock()
+
+        mock_bot.send_message.side_effect = send_message
+
+        result = await notify_admins_with_fallback_and_cleanup(
+            mock_bot,
+            admin_ids,
+            -1001234567890,
+            "Test message",
+            assume_human_admins=True,
+        )
+
+        assert peak == len(admin_ids)
+        assert result["notified_private"] == [111, 333]
+        assert result["unreachable"] == [222]
+        mock_bot.get_chat.assert_awaited_once_with(222)
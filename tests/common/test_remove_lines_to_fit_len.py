@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from app.common.utils import remove_lines_to_fit_len
+
+
+def _reference(text: str, max_len: int) -> str:
+    """Previous line-at-a-time implementation, kept as the behavioral spec."""
+    splitted = text.split("\n")
+    while len(text) > max_len - len("...\n") and len(splitted) > 2:
+        half = len(splitted) // 2
+        text = "\n".join(splitted[:half] + ["..."] + splitted[half + 1 :])
+        splitted = splitted[:half] + splitted[half + 1 :]
+    if len(text) > max_len:
+        text = text[: max_len - len("...")] + "..."
+    return text
+
+
+@pytest.mark.parametrize(
+    "text, max_len",
+    [
+        ("short", 100),
+        ("", 10),
+        ("a\nb", 3),
+        ("line1\nline2\nline3", 10),
+        ("\n".join(f"line {i}" for i in range(50)), 60),
+        ("\n".join(f"line {i}" for i in range(51)), 60),
+        ("x" * 500 + "\n" + "y" * 500, 100),
+    ],
+)
+def test_matches_reference(text, max_len):
+    assert remove_lines_to_fit_len(text, max_len) == _reference(text, max_len)
+
+
+def test_matches_reference_on_random_tracebacks():
+    rng = random.Random(0)
+    for _ in range(300):
+        lines = ["z" * rng.randint(0, 40) for _ in range(rng.randint(0, 60))]
+        text = "\n".join(lines)
+        max_len = rng.randint(5, 400)
+        assert remove_lines_to_fit_len(text, max_len) == _reference(text, max_len)
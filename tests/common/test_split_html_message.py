@@ -0,0 +1,45 @@
+"""Tests for split_html_message."""
+
+from src.app.common.utils import split_html_message
+
+
+def test_short_message_is_not_split():
+    assert split_html_message("<b>hi</b>") == ["<b>hi</b>"]
+
+
+def test_splits_on_paragraphs_within_limit():
+    text = "\n\n".join(["a" * 40, "b" * 40, "c" * 40])
+    chunks = split_html_message(text, limit=90)
+    assert chunks == ["a" * 40 + "\n\n" + "b" * 40, "c" * 40]
+
+
+def test_tags_spanning_chunks_are_closed_and_reopened():
+    text = "<b>" + "a" * 50 + "\n\n" + "b" * 50 + "</b>"
+    chunks = split_html_message(text, limit=60)
+    assert chunks == ["<b>" + "a" * 50 + "</b>", "<b>" + "b" * 50 + "</b>"]
+
+
+def test_hard_cut_does_not_break_tags():
+    text = "x" * 55 + '<a href="https://t.me">link</a>'
+    chunks = split_html_message(text, limit=60)
+    assert chunks[0] == "x" * 55
+    assert chunks[1].startswith('<a href="https://t.me">')
+    assert all(len(chunk) <= 60 for chunk in chunks)
+
+
+def test_void_tags_are_not_reopened():
+    text = "a" * 40 + "<br>\n\n" + "b" * 40
+    chunks = split_html_message(text, limit=60)
+    assert chunks == ["a" * 40 + "<br>", "b" * 40]
+
+
+def test_hard_cut_does_not_break_entities():
+    text = "x" * 57 + "&amp;" + "y" * 20
+    chunks = split_html_message(text, limit=60)
+    assert chunks == ["x" * 57, "&amp;" + "y" * 20]
+
+
+def test_hard_cut_keeps_leading_tag_whole():
+    tag = '<a href="https://t.me/' + "z" * 70 + '">'
+    chunks = split_html_message(tag + "link</a>", limit=60)
+    assert chunks == [tag + "</a>", tag + "link</a>"]
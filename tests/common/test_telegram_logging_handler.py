@@ -121,3 +121,38 @@ async def test_handler_stop_drains_remaining_on_timeout():
     assert bot.calls[0]["text"] == "<pre>msg1</pre>"
     assert bot.calls[1]["text"] == "<pre>msg2</pre>"
     assert bot.calls[2]["text"] == "<pre>msg3</pre>"
+
+
+@pytest.mark.asyncio
+async def test_throttled_warnings_are_not_formatted():
+    class CountingFormatter(logging.Formatter):
+        calls = 0
+
+        def format(self, record):
+            CountingFormatter.calls += 1
+            return super().format(record)
+
+    bot = DummyBot()
+    handler = TelegramLogHandler(
+        bot=bot,  # type: ignore
+        chat_id=123,
+        throttling_capacity=1,
+        dedupe_window=0.0,
+    )
+    handler.setFormatter(CountingFormatter("%(message)s"))
+    handler.set_event_loop(asyncio.get_running_loop())
+
+    logger = logging.getLogger("tests.telegram_logger.throttled_format")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    logger.warning("first")
+    logger.warning("second")
+    logger.error("error")
+
+    await handler.stop()
+    logger.removeHandler(handler)
+
+    assert CountingFormatter.calls == 2
+    assert [c["text"] for c in bot.calls] == ["<pre>first</pre>", "<pre>error</pre>"]
@@ -0,0 +1,37 @@
+"""Tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+from app.common.ttl_cache import TTLCache
+
+
+def test_get_returns_stored_value_until_expiry():
+    cache: TTLCache[str] = TTLCache(ttl=10)
+    with patch("app.common.ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+    with patch("app.common.ttl_cache.time.monotonic", return_value=110.0):
+        assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used_when_full():
+    cache: TTLCache[int] = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_and_clear():
+    cache: TTLCache[int] = TTLCache(ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,90 @@
+"""Tests for the write-behind queue used for off-critical-path DB writes."""
+
+import asyncio
+
+import pytest
+
+from app.common.write_behind import WriteBehindQueue
+
+
+class Recorder:
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, items):
+        self.batches.append(list(items))
+
+
+@pytest.mark.asyncio
+async def test_submit_writes_through_when_not_started():
+    recorder = Recorder()
+    queue = WriteBehindQueue("test", recorder, key=lambda item: item[0])
+
+    await queue.submit((1, "a"))
+
+    assert recorder.batches == [[(1, "a")]]
+
+
+@pytest.mark.asyncio
+async def test_batches_and_dedupes_by_key():
+    recorder = Recorder()
+    queue = WriteBehindQueue("test", recorder, key=lambda item: item[0], max_delay=0.05)
+    queue.start()
+
+    await queue.submit((1, "a"))
+    await queue.submit((2, "b"))
+    await queue.submit((1, "c"))
+    assert recorder.batches == []
+
+    await asyncio.sleep(0.1)
+    await queue.stop()
+
+    assert recorder.batches == [[(1, "c"), (2, "b")]]
+
+
+@pytest.mark.asyncio
+async def test_merge_combines_items_with_same_key():
+    recorder = Recorder()
+    queue = WriteBehindQueue(
+        "test",
+        recorder,
+        key=lambda item: item[0],
+        merge=lambda older, newer: (newer[0], newer[1] or older[1]),
+        max_delay=0.05,
+    )
+    queue.start()
+
+    await queue.submit((1, "context"))
+    await queue.submit((1, None))
+    await asyncio.sleep(0.1)
+    await queue.stop()
+
+    assert recorder.batches == [[(1, "context")]]
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_items():
+    recorder = Recorder()
+    queue = WriteBehindQueue("test", recorder, key=lambda item: item, max_delay=10)
+    queue.start()
+
+    await queue.submit(1)
+    await queue.submit(2)
+    await asyncio.sleep(0)
+    await queue.stop()
+
+    assert [item for batch in recorder.batches for item in batch] == [1, 2]
+    assert not queue.is_running
+
+
+@pytest.mark.asyncio
+async def test_keeps_every_item_without_key():
+    recorder = Recorder()
+    queue = WriteBehindQueue("test", recorder, max_delay=0.05)
+    queue.start()
+
+    await queue.submit((1, 2))
+    await queue.submit((1, 2))
+    await queue.stop()
+
+    assert recorder.batches == [[(1, 2), (1, 2)]]
@@ -67,6 +67,8 @@ from app.database import (
     postgres_connection,
 )
 from app.database.models import ModerationMode
+from app.database.message_operations import _history_cache
+from app.database.spam_examples import _examples_cache
 
 # Test database settings - use SQLite for fast local testing
 USE_SQLITE = os.getenv("USE_SQLITE_TESTS", "true").lower() == "true"
@@ -612,6 +614,8 @@ async def patched_get_pool(clean_db):
 @pytest.fixture(scope="function")
 async def clean_db(patched_db_conn, test_pool):
     """Ensure a clean database state before each test"""
+    _examples_cache.clear()
+    _history_cache.clear()
     if USE_SQLITE:
         # For SQLite, truncate all tables since transactions don't work the same way
         conn = test_pool.acquire()
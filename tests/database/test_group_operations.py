@@ -1,3 +1,7 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 
 from app.database import (
@@ -6,6 +10,8 @@ from app.database import (
     clear_no_rights_detected_at,
     deduct_credits_from_admins,
     get_admin_group_ids,
+    get_admin_groups,
+    get_groups_with_paying_admins,
     get_groups_with_no_rights_past_grace,
     get_moderation_event_count,
     get_paying_admins,
@@ -17,7 +23,9 @@ from app.database import (
     set_group_moderation,
     set_moderation_events,
     set_no_rights_detected_at,
+    update_group_admins,
 )
+from app.database.group_operations import moderation_events_queue
 
 
 @pytest.mark.asyncio
@@ -216,6 +224,80 @@ async def test_get_admin_group_ids(patched_db_conn, clean_db):
     assert set(ids) == {1, 2}
 
 
+@pytest.mark.asyncio
+async def test_get_admin_groups_fetches_chats_concurrently(patched_db_conn, clean_db):
+    """Chat titles for all groups are requested from Telegram in parallel."""
+    async with clean_db.acquire() as conn:
+        await conn.execute(
+            "INSERT INTO groups (group_id, moderation_enabled) VALUES (1, 1), (2, 0)"
+        )
+        await conn.execute(
+            "INSERT INTO administrators (admin_id, username, credits) VALUES (99, 'x', 10)"
+        )
+        await conn.execute(
+            "INSERT INTO group_administrators (group_id, admin_id) VALUES (1, 99), (2, 99)"
+        )
+
+    in_flight = 0
+    peak = 0
+
+    async def get_chat(chat_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SimpleNamespace(title=f"Group {chat_id}")
+
+    with patch("app.database.group_operations.bot.get_chat", side_effect=get_chat):
+        groups = await get_admin_groups(99)
+
+    assert peak == 2
+    assert sorted(
+        (g["id"], g["title"], bool(g["is_moderation_enabled"])) for g in groups
+    ) == [
+        (1, "Group 1", True),
+        (2, "Group 2", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_admin_groups_bounds_concurrent_chat_lookups(
+    patched_db_conn, clean_db
+):
+    """No more than MAX_PARALLEL_CHAT_LOOKUPS get_chat calls run at once."""
+    async with clean_db.acquire() as conn:
+        await conn.execute(
+            "INSERT INTO groups (group_id, moderation_enabled) VALUES (1, 1), (2, 1), (3, 1)"
+        )
+        await conn.execute(
+            "INSERT INTO administrators (admin_id, username, credits) VALUES (99, 'x', 10)"
+        )
+        await conn.execute(
+            "INSERT INTO group_administrators (group_id, admin_id) VALUES (1, 99), (2, 99), (3, 99)"
+        )
+
+    in_flight = 0
+    peak = 0
+
+    async def get_chat(chat_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SimpleNamespace(title=f"Group {chat_id}")
+
+    with (
+        patch("app.database.group_operations.MAX_PARALLEL_CHAT_LOOKUPS", 2),
+        patch("app.database.group_operations.bot.get_chat", side_effect=get_chat),
+    ):
+        groups = await get_admin_groups(99)
+
+    assert peak == 2
+    assert len(groups) == 3
+
+
 @pytest.mark.asyncio
 async def test_set_no_rights_detected_at(patched_db_conn, clean_db):
     """set_no_rights_detected_at sets timestamp only when NULL."""
@@ -327,6 +409,23 @@ async def test_increment_moderation_events(patched_db_conn, clean_db):
     assert await get_moderation_event_count(group_id, member_id) == 2
 
 
+@pytest.mark.asyncio
+async def test_queued_moderation_events_are_summed(patched_db_conn, clean_db):
+    group_id = 555013
+    member_id = 777013
+    async with clean_db.acquire() as conn:
+        await conn.execute("INSERT INTO groups (group_id) VALUES ($1)", group_id)
+
+    await add_member(group_id, member_id)
+    moderation_events_queue.start()
+    try:
+        for _ in range(3):
+            await increment_moderation_events(group_id, member_id)
+    finally:
+        await moderation_events_queue.stop()
+    assert await get_moderation_event_count(group_id, member_id) == 4
+
+
 @pytest.mark.asyncio
 async def test_remove_member_clears_probation_counter(patched_db_conn, clean_db):
     group_id = 555004
@@ -337,3 +436,66 @@ async def test_remove_member_clears_probation_counter(patched_db_conn, clean_db)
     await set_moderation_events(group_id, member_id, 3)
     await remove_member_from_group(member_id, group_id)
     assert await get_moderation_event_count(group_id, member_id) is None
+
+
+@pytest.mark.asyncio
+async def test_deduct_credits_disables_moderation_on_failure(patched_db_conn, clean_db):
+    """Failed deduction with disable_on_failure turns moderation off atomically."""
+    async with clean_db.acquire() as conn:
+        group_id = 555556
+        admin_id = 778
+        await conn.execute(
+            "INSERT INTO groups (group_id, moderation_enabled) VALUES ($1, $2)",
+            group_id,
+            True,
+        )
+        await conn.execute(
+            "INSERT INTO administrators (admin_id, username, credits) VALUES ($1, 'poor', 0)",
+            admin_id,
+        )
+        await conn.execute(
+            "INSERT INTO group_administrators (group_id, admin_id) VALUES ($1, $2)",
+            group_id,
+            admin_id,
+        )
+
+    assert await deduct_credits_from_admins(group_id, 1) == 0
+    assert await is_moderation_enabled(group_id) is True
+
+    assert await deduct_credits_from_admins(group_id, 1, disable_on_failure=True) == 0
+    assert await is_moderation_enabled(group_id) is False
+
+
+@pytest.mark.asyncio
+async def test_get_groups_with_paying_admins(patched_db_conn, clean_db):
+    """Only groups with at least one admin holding credits are returned."""
+    async with clean_db.acquire() as conn:
+        await conn.execute("INSERT INTO groups (group_id) VALUES (1), (2), (3)")
+        await conn.execute(
+            "INSERT INTO administrators (admin_id, username, credits) "
+            "VALUES (10, 'rich', 5), (20, 'broke', 0)"
+        )
+        await conn.execute(
+            "INSERT INTO group_administrators (group_id, admin_id) "
+            "VALUES (1, 10), (1, 20), (2, 20), (3, 10)"
+        )
+
+    assert await get_groups_with_paying_admins([1, 2]) == {1}
+    assert await get_groups_with_paying_admins([]) == set()
+
+
+@pytest.mark.asyncio
+async def test_update_group_admins_creates_admins_in_batch(patched_db_conn, clean_db):
+    """New admins get initial credits and are linked to the group."""
+    await update_group_admins(4242, [501, 502], ["first", None])
+
+    assert sorted(await get_admin_group_ids(501)) == [4242]
+    assert sorted(await get_admin_group_ids(502)) == [4242]
+    async with clean_db.acquire() as conn:
+        row = await conn.fetchrow(
+            "SELECT username, credits, moderation_mode FROM administrators WHERE admin_id = $1",
+            501,
+        )
+    assert row["username"] == "first"
+    assert row["credits"] > 0
+    assert row["moderation_mode"] == "notify"
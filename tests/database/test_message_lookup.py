@@ -0,0 +1,18 @@
+"""Tests for the message lookup cache write path."""
+
+from app.database.message_lookup import _merge_lookup_entries
+
+
+def test_merge_keeps_earlier_context_when_later_entry_lacks_it():
+    older = (1, 2, 3, "old text", "reply", "stories", "signals")
+    newer = (1, 2, 3, "new text", None, None, "new signals")
+
+    assert _merge_lookup_entries(older, newer) == (
+        1,
+        2,
+        3,
+        "new text",
+        "reply",
+        "stories",
+        "new signals",
+    )
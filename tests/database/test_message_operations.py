@@ -0,0 +1,61 @@
+import pytest
+
+from app.database import clear_message_history, get_message_history, save_messages
+from app.database.message_operations import MESSAGE_HISTORY_SIZE
+
+
+@pytest.mark.asyncio
+async def test_save_messages_keeps_order(patched_db_conn, clean_db):
+    admin_id = 880001
+    async with clean_db.acquire() as conn:
+        await conn.execute(
+            "INSERT INTO administrators (admin_id, credits) VALUES ($1, 0)", admin_id
+        )
+
+    await save_messages(admin_id, [("user", "question"), ("assistant", "answer")])
+
+    assert await get_message_history(admin_id) == [
+        {"role": "user", "content": "question"},
+        {"role": "assistant", "content": "answer"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_save_messages_trims_history(patched_db_conn, clean_db):
+    admin_id = 880002
+    async with clean_db.acquire() as conn:
+        await conn.execute(
+            "INSERT INTO administrators (admin_id, credits) VALUES ($1, 0)", admin_id
+        )
+
+    await save_messages(
+        admin_id, [("user", str(i)) for i in range(MESSAGE_HISTORY_SIZE + 2)]
+    )
+
+    history = await get_message_history(admin_id)
+    assert len(history) == MESSAGE_HISTORY_SIZE
+    assert history[0]["content"] == "2"
+    assert history[-1]["content"] == str(MESSAGE_HISTORY_SIZE + 1)
+
+
+@pytest.mark.asyncio
+async def test_history_cache_follows_saves(patched_db_conn, clean_db):
+    admin_id = 880003
+    async with clean_db.acquire() as conn:
+        await conn.execute(
+            "INSERT INTO administrators (admin_id, credits) VALUES ($1, 0)", admin_id
+        )
+
+    assert await get_message_history(admin_id) == []
+    await save_messages(admin_id, [("user", "q"), ("assistant", "a")])
+
+    # Served from the cache, which was updated by the save above
+    async with clean_db.acquire() as conn:
+        await conn.execute("DELETE FROM message_history WHERE admin_id = $1", admin_id)
+    assert await get_message_history(admin_id) == [
+        {"role": "user", "content": "q"},
+        {"role": "assistant", "content": "a"},
+    ]
+
+    await clear_message_history(admin_id)
+    assert await get_message_history(admin_id) == []
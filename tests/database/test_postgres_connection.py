@@ -0,0 +1,28 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.database import postgres_connection
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_callers_share_one_pool():
+    pool = object()
+
+    async def create_pool(**_kwargs):
+        await asyncio.sleep(0.01)
+        return pool
+
+    create = AsyncMock(side_effect=create_pool)
+    original_pool, postgres_connection._pool = postgres_connection._pool, None
+    try:
+        with patch.object(postgres_connection.asyncpg, "create_pool", create):
+            first, second = await asyncio.gather(
+                postgres_connection.get_pool(), postgres_connection.get_pool()
+            )
+    finally:
+        postgres_connection._pool = original_pool
+
+    assert first is second is pool
+    create.assert_awaited_once()
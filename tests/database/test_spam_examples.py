@@ -499,3 +499,22 @@ async def test_confirm_pending_example_as_spam_not_found(patched_db_conn, clean_
         chat_id=999999, message_id=999999, admin_id=12345
     )
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_get_spam_examples_cached_until_write(patched_db_conn, clean_db):
+    """Repeated reads are served from cache; adding an example invalidates it"""
+    await add_spam_example(text="first spam", score=80)
+    first = await get_spam_examples()
+
+    async with clean_db.acquire() as conn:
+        await conn.execute(
+            "INSERT INTO spam_examples (text, score, confirmed) VALUES ($1, $2, true)",
+            "inserted behind the cache",
+            90,
+        )
+    assert await get_spam_examples() is first
+
+    await add_spam_example(text="second spam", score=70)
+    texts = {example["text"] for example in await get_spam_examples()}
+    assert {"first spam", "second spam", "inserted behind the cache"} <= texts
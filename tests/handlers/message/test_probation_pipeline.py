@@ -158,3 +158,23 @@ async def test_handle_moderated_message_increments_after_probation_message(
         result = await handle_moderated_message(mock_message)
         assert result == "message_user_approved"
         mock_inc.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_moderated_message_early_exit_skips_membership_lookup(
+    mock_message,
+):
+    with (
+        patch(
+            "src.app.handlers.message.pipeline.is_member_in_group",
+            new_callable=AsyncMock,
+        ) as mock_is_member,
+        patch(
+            "src.app.handlers.message.pipeline.validate_group_and_check_early_exits",
+            new_callable=AsyncMock,
+            return_value=(None, "message_moderation_disabled"),
+        ),
+    ):
+        result = await handle_moderated_message(mock_message)
+        assert result == "message_moderation_disabled"
+        mock_is_member.assert_not_called()
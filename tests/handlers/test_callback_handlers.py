@@ -2,6 +2,11 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from aiogram.types import CallbackQuery, User, Message, Chat
 
+from src.app.handlers.callback_data import (
+    DeleteSpamCallback,
+    MarkNotSpamCallback,
+    SpamExampleCallback,
+)
 from src.app.handlers.callback_handlers import (
     handle_spam_confirm_callback,
     handle_spam_ignore_callback,
@@ -52,7 +57,9 @@ async def test_handle_spam_ignore_callback_answer_error():
         mock_bot.edit_message_text = AsyncMock()
         mock_bot.unban_chat_member = AsyncMock()
 
-        result = await handle_spam_ignore_callback(callback)
+        result = await handle_spam_ignore_callback(
+            callback, MarkNotSpamCallback.unpack(callback.data)
+        )
 
         assert result == "callback_marked_as_not_spam"
         mock_confirm.assert_called_once_with(1, 999)
@@ -73,7 +80,9 @@ async def test_handle_spam_ignore_callback_confirm_raises():
         new_callable=AsyncMock,
         side_effect=Exception("Network error"),
     ):
-        result = await handle_spam_ignore_callback(callback)
+        result = await handle_spam_ignore_callback(
+            callback, MarkNotSpamCallback.unpack(callback.data)
+        )
 
         assert result == "callback_error_marking_not_spam"
 
@@ -117,7 +126,9 @@ async def test_handle_spam_confirm_callback_deletes_and_bans():
         mock_get_admin.return_value = None
         mock_get_group.return_value = None  # Group not in DB - admin_ids=None
 
-        result = await handle_spam_confirm_callback(callback)
+        result = await handle_spam_confirm_callback(
+            callback, DeleteSpamCallback.unpack(callback.data)
+        )
 
         assert result == "callback_spam_message_deleted"
         mock_confirm_spam.assert_called_once_with(67890, 111, 999)
@@ -128,3 +139,20 @@ async def test_handle_spam_confirm_callback_deletes_and_bans():
         call_kwargs = mock_bot.edit_message_text.call_args.kwargs
         assert call_kwargs["reply_markup"] is None
         assert "✅" in call_kwargs["text"] and "Spam deleted" in call_kwargs["text"]
+
+
+def test_spam_callback_data_keeps_legacy_format():
+    """Packed callback_data stays compatible with already-sent notifications."""
+    packed = DeleteSpamCallback(
+        user_id=12345, chat_id=-1001234567890, message_id=111
+    ).pack()
+    assert packed == "delete_spam_message:12345:-1001234567890:111"
+    assert len(packed.encode()) <= 64
+    assert MarkNotSpamCallback(pending_id=7).pack() == "mark_as_not_spam:7"
+
+
+def test_spam_example_callback_data_keeps_legacy_format():
+    """Forward prompts sent before the switch still parse."""
+    assert SpamExampleCallback(action="spam").pack() == "spam_example:spam"
+    assert SpamExampleCallback(action="not_spam").pack() == "spam_example:not_spam"
+    assert SpamExampleCallback.unpack("spam_example:not_spam").action == "not_spam"
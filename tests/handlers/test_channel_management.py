@@ -8,6 +8,7 @@ from aiogram.exceptions import TelegramForbiddenError
 from src.app.handlers.message.channel_management import (
     build_channel_instruction_message,
     build_channel_instruction_userbot_message,
+    notify_channel_admins,
     notify_channel_admins_and_leave,
 )
 
@@ -78,6 +79,8 @@ async def test_notify_channel_admins_and_leave_forbidden_fallback_userbot():
         mock_send_userbot.assert_called_once()
         call_kwargs = mock_send_userbot.call_args.kwargs
         assert call_kwargs["username"] == "channeladmin"
+        # Admins are fetched once and shared by language lookup and notification
+        bot.get_chat_administrators.assert_awaited_once_with(chat.id)
         assert call_kwargs["user_id"] == 12345
         assert "@ai_antispam_blocker_bot" in call_kwargs["message"]
 
@@ -151,3 +154,29 @@ async def test_notify_channel_admins_and_leave_forbidden_does_not_raise():
     ):
         # Should not raise
         await notify_channel_admins_and_leave(chat, bot, adding_user=None)
+
+
+@pytest.mark.asyncio
+async def test_notify_channel_admins_skips_bots_and_failures():
+    """Sends go out together; only delivered human admins are reported."""
+
+    def member(user_id, is_bot=False):
+        admin = MagicMock()
+        admin.user.id = user_id
+        admin.user.is_bot = is_bot
+        return admin
+
+    async def send_message(chat_id, *args, **kwargs):
+        if chat_id == 2:
+            raise Exception("blocked")
+
+    chat = MagicMock()
+    chat.id = -100
+    bot = AsyncMock()
+    bot.send_message = AsyncMock(side_effect=send_message)
+    admins = [member(1), member(2), member(3, is_bot=True), member(4)]
+
+    notified = await notify_channel_admins(chat, "hi", bot, admins)
+
+    assert notified == [1, 4]
+    bot.get_chat_administrators.assert_not_awaited()
@@ -7,3 +7,14 @@ from src.app.handlers.updates_filter import filter_handle_edited_message
 def test_edited_message_handler_registered():
     assert hasattr(message_handlers, "handle_moderated_edited_message")
     assert filter_handle_edited_message is not None
+
+
+def test_handlers_registered_once():
+    """A handler module imported twice would process every update twice."""
+    import src.app.handlers  # noqa: F401  (registers every handler on dp)
+    from src.app.handlers.dp import dp
+
+    assert dp.message.handlers and dp.callback_query.handlers
+    for name, observer in dp.observers.items():
+        callbacks = [handler.callback for handler in observer.handlers]
+        assert len(callbacks) == len(set(callbacks)), name
@@ -0,0 +1,51 @@
+"""Tests for the successful payment handler."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.handlers import payment_handlers
+
+
+def _payment_message(language_code: str = "en") -> MagicMock:
+    message = MagicMock()
+    message.from_user.id = 42
+    message.from_user.language_code = language_code
+    message.successful_payment.total_amount = 100
+    return message
+
+
+@pytest.mark.asyncio
+async def test_successful_payment_uses_language_from_payment_call():
+    send_message = AsyncMock()
+    with (
+        patch.object(
+            payment_handlers,
+            "record_successful_payment",
+            AsyncMock(return_value="ru"),
+        ) as record,
+        patch.object(payment_handlers, "get_admin", AsyncMock()) as get_admin,
+        patch.object(payment_handlers.bot, "send_message", send_message),
+    ):
+        result = await payment_handlers.process_successful_payment(_payment_message())
+
+    assert result == "payment_successful_processed"
+    record.assert_awaited_once_with(42, 100)
+    get_admin.assert_not_called()
+    assert "Поздравляю" in send_message.await_args.args[1]
+
+
+@pytest.mark.asyncio
+async def test_successful_payment_falls_back_to_telegram_language():
+    send_message = AsyncMock()
+    with (
+        patch.object(
+            payment_handlers,
+            "record_successful_payment",
+            AsyncMock(return_value=None),
+        ),
+        patch.object(payment_handlers.bot, "send_message", send_message),
+    ):
+        await payment_handlers.process_successful_payment(_payment_message("en"))
+
+    assert "Congrats" in send_message.await_args.args[1]
@@ -1,10 +1,14 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 from datetime import datetime, timezone
 
 from aiogram import types
 
-from src.app.handlers.private_handlers import extract_original_message_info
+from src.app.handlers.private_handlers import (
+    _bio_cache,
+    _safe_get_chat_bio,
+    extract_original_message_info,
+)
 
 
 class TestExtractOriginalMessageInfo:
@@ -40,6 +44,7 @@ class TestExtractOriginalMessageInfo:
     @pytest.fixture
     def mock_bot_get_chat(self):
         """Mock bot.get_chat for user bio retrieval."""
+        _bio_cache.clear()
         with patch("src.app.handlers.private_handlers.bot") as mock_bot:
             mock_chat = MagicMock()
             mock_chat.bio = "Spammer bio"
@@ -55,9 +60,10 @@ class TestExtractOriginalMessageInfo:
 
         # Mock admin groups
         with patch(
-            "src.app.handlers.private_handlers.get_admin_groups", new_callable=AsyncMock
+            "src.app.handlers.private_handlers.get_admin_group_ids",
+            new_callable=AsyncMock,
         ) as mock_get_groups:
-            mock_get_groups.return_value = [{"id": 1001}, {"id": 1002}, {"id": 1003}]
+            mock_get_groups.return_value = [1001, 1002, 1003]
 
             # Mock successful DB lookup
             with patch(
@@ -100,9 +106,10 @@ class TestExtractOriginalMessageInfo:
 
         # Mock admin groups
         with patch(
-            "src.app.handlers.private_handlers.get_admin_groups", new_callable=AsyncMock
+            "src.app.handlers.private_handlers.get_admin_group_ids",
+            new_callable=AsyncMock,
         ) as mock_get_groups:
-            mock_get_groups.return_value = [{"id": 1001}, {"id": 1002}]
+            mock_get_groups.return_value = [1001, 1002]
 
             # Mock DB lookup returning None
             with patch(
@@ -129,7 +136,8 @@ class TestExtractOriginalMessageInfo:
 
         # Mock empty admin groups
         with patch(
-            "src.app.handlers.private_handlers.get_admin_groups", new_callable=AsyncMock
+            "src.app.handlers.private_handlers.get_admin_group_ids",
+            new_callable=AsyncMock,
         ) as mock_get_groups:
             mock_get_groups.return_value = []
 
@@ -175,7 +183,8 @@ class TestExtractOriginalMessageInfo:
 
         # Message lookup should not be called since we have metadata
         with patch(
-            "src.app.handlers.private_handlers.get_admin_groups", new_callable=AsyncMock
+            "src.app.handlers.private_handlers.get_admin_group_ids",
+            new_callable=AsyncMock,
         ) as mock_get_groups:
             with patch(
                 "src.app.handlers.private_handlers.find_message_by_text_and_user",
@@ -214,9 +223,10 @@ class TestExtractOriginalMessageInfo:
 
         # Mock admin groups
         with patch(
-            "src.app.handlers.private_handlers.get_admin_groups", new_callable=AsyncMock
+            "src.app.handlers.private_handlers.get_admin_group_ids",
+            new_callable=AsyncMock,
         ) as mock_get_groups:
-            mock_get_groups.return_value = [{"id": 1001}, {"id": 1002}]
+            mock_get_groups.return_value = [1001, 1002]
 
             # Mock successful DB lookup (recover user_id from cache)
             with patch(
@@ -261,3 +271,261 @@ class TestExtractOriginalMessageInfo:
         # Should raise OriginalMessageExtractionError
         with pytest.raises(Exception):  # OriginalMessageExtractionError
             await extract_original_message_info(callback_message, admin_id)
+
+
+@pytest.mark.asyncio
+async def test_chat_bio_cached_per_user():
+    _bio_cache.clear()
+    with patch("src.app.handlers.private_handlers.bot") as mock_bot:
+        mock_bot.get_chat = AsyncMock(return_value=MagicMock(bio=None))
+        assert await _safe_get_chat_bio(1) is None
+        assert await _safe_get_chat_bio(1) is None
+        mock_bot.get_chat.assert_awaited_once_with(1)
+    _bio_cache.clear()
+
+
+def test_prd_text_is_read_once(tmp_path, monkeypatch):
+    from src.app.handlers.private_handlers import _load_prd_text
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "PRD.md").write_text("first", encoding="utf-8")
+    _load_prd_text.cache_clear()
+    try:
+        assert _load_prd_text() == "first"
+        (tmp_path / "PRD.md").write_text("second", encoding="utf-8")
+        assert _load_prd_text() == "first"
+    finally:
+        _load_prd_text.cache_clear()
+
+
+def test_format_prompt_example_renders_all_fields():
+    from src.app.handlers.private_handlers import _format_prompt_example
+
+    rendered = _format_prompt_example(
+        {
+            "text": "hi",
+            "name": "Bob",
+            "bio": "crypto",
+            "linked_channel_fragment": "@chan",
+            "score": -100,
+        }
+    )
+    assert rendered == (
+        "<пример>\n<запрос>\n<текст сообщения>\nhi\n</текст сообщения>"
+        "\n<имя>Bob</имя>\n<биография>crypto</биография>\n<канал>@chan</канал>"
+        "\n</запрос>\n<ответ>\nнет 100%\n</ответ>\n</пример>"
+    )
+
+
+def test_system_prompt_reused_for_same_examples():
+    from src.app.handlers.private_handlers import (
+        _SYSTEM_PROMPT_SUFFIX,
+        _build_system_prompt,
+        _format_prompt_example,
+        _system_prompt_prefix,
+    )
+
+    block = _format_prompt_example({"text": "buy now", "score": 90})
+    _build_system_prompt.cache_clear()
+    try:
+        prompt = _build_system_prompt(block)
+        assert "buy now" in prompt
+        assert "да 90%" in prompt
+        assert prompt == _system_prompt_prefix() + block + _SYSTEM_PROMPT_SUFFIX
+        assert f"<примеры>\n{block}\n</примеры>" in prompt
+        assert _build_system_prompt(block) is prompt
+        assert _build_system_prompt(block + "\n") is not prompt
+    finally:
+        _build_system_prompt.cache_clear()
+
+
+def test_conversation_transcript_ends_with_current_message_once():
+    from src.app.handlers.private_handlers import _format_conversation
+
+    history = [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+    ]
+
+    transcript = _format_conversation(history, "how are you?")
+
+    assert transcript == "USER: hi\nASSISTANT: hello\n\nUSER: how are you?"
+    assert transcript.count("how are you?") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("text", [None, "", "   \n\t"])
+async def test_private_message_without_text_skips_all_io(text):
+    from src.app.handlers import private_handlers
+
+    message = MagicMock()
+    message.text = text
+    with (
+        patch.object(private_handlers, "initialize_new_admin", AsyncMock()) as init,
+        patch.object(private_handlers, "get_message_history", AsyncMock()) as history,
+    ):
+        result = await private_handlers.handle_private_message(message)
+
+    assert result == "private_no_message_text"
+    init.assert_not_called()
+    history.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("lang", "is_spam", "expected"),
+    [
+        ("en", True, "spam"),
+        ("en", False, "valuable"),
+        ("ru", True, "спама"),
+        ("ru", False, "ценного сообщения"),
+    ],
+)
+def test_example_type_label(lang, is_spam, expected):
+    from src.app.handlers.private_handlers import _resolve_example_texts
+
+    assert _resolve_example_texts(lang, is_spam)[1] == expected
+
+
+@pytest.mark.asyncio
+async def test_private_message_saves_both_turns_in_one_call():
+    from types import SimpleNamespace
+
+    from src.app.handlers import private_handlers
+
+    message = MagicMock()
+    message.text = "hello bot"
+    message.from_user.id = 7
+    message.from_user.username = "admin7"
+    message.reply = AsyncMock()
+    agent = MagicMock()
+    agent.run = AsyncMock(return_value=SimpleNamespace(output="<b>hi</b>"))
+
+    with (
+        patch.object(private_handlers, "initialize_new_admin", AsyncMock()),
+        patch.object(private_handlers, "update_admin_username_if_needed", AsyncMock()),
+        patch.object(
+            private_handlers,
+            "get_message_history",
+            AsyncMock(return_value=[{"role": "assistant", "content": "earlier"}]),
+        ),
+        patch.object(private_handlers, "get_spam_examples", AsyncMock(return_value=[])),
+        patch.object(private_handlers, "get_chat_agent", return_value=agent),
+        patch.object(private_handlers, "get_llm_route_timeout", return_value=30),
+        patch.object(private_handlers, "save_messages", AsyncMock()) as save,
+    ):
+        result = await private_handlers.handle_private_message(message)
+
+    assert result == "private_message_replied"
+    assert agent.run.await_args.args[0] == "ASSISTANT: earlier\n\nUSER: hello bot"
+    save.assert_awaited_once_with(
+        7, [("user", "hello bot"), ("assistant", "<b>hi</b>")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_private_message_user_turn_saved_when_all_providers_fail():
+    from src.app.handlers import private_handlers
+
+    message = MagicMock()
+    message.text = "hello bot"
+    message.from_user.id = 7
+    message.reply = AsyncMock()
+    agent = MagicMock()
+    agent.run = AsyncMock(side_effect=RuntimeError("provider down"))
+
+    with (
+        patch.object(private_handlers, "_register_admin", AsyncMock()),
+        patch.object(
+            private_handlers, "get_message_history", AsyncMock(return_value=[])
+        ),
+        patch.object(private_handlers, "get_spam_examples", AsyncMock(return_value=[])),
+        patch.object(private_handlers, "get_chat_agent", return_value=agent),
+        patch.object(private_handlers, "_get_openrouter_chat_agents", return_value=[]),
+        patch.object(private_handlers, "get_llm_route_timeout", return_value=30),
+        patch.object(private_handlers, "save_messages", AsyncMock()) as save,
+    ):
+        with pytest.raises(RuntimeError, match="All chat providers failed"):
+            await private_handlers.handle_private_message(message)
+
+    save.assert_awaited_once_with(7, [("user", "hello bot")])
+
+
+@pytest.mark.asyncio
+async def test_private_chat_llm_calls_are_bounded():
+    import asyncio
+    from types import SimpleNamespace
+
+    from src.app.handlers import private_handlers
+
+    in_flight = 0
+    peak = 0
+
+    async def run(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SimpleNamespace(output="ok")
+
+    agent = MagicMock()
+    agent.run = run
+
+    def make_message(user_id):
+        message = MagicMock()
+        message.text = "hello bot"
+        message.from_user.id = user_id
+        message.reply = AsyncMock()
+        return message
+
+    with (
+        patch.object(private_handlers, "_chat_llm_semaphore", asyncio.Semaphore(2)),
+        patch.object(private_handlers, "_register_admin", AsyncMock()),
+        patch.object(
+            private_handlers, "get_message_history", AsyncMock(return_value=[])
+        ),
+        patch.object(private_handlers, "get_spam_examples", AsyncMock(return_value=[])),
+        patch.object(private_handlers, "get_chat_agent", return_value=agent),
+        patch.object(private_handlers, "get_llm_route_timeout", return_value=30),
+        patch.object(private_handlers, "save_messages", AsyncMock()),
+    ):
+        results = await asyncio.gather(
+            *(
+                private_handlers.handle_private_message(make_message(i))
+                for i in range(5)
+            )
+        )
+
+    assert results == ["private_message_replied"] * 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_reply_in_chunks_does_not_resend_delivered_chunks():
+    from aiogram.exceptions import TelegramBadRequest
+
+    from src.app.handlers import private_handlers
+
+    message = MagicMock()
+    message.reply = AsyncMock()
+    message.answer = AsyncMock(
+        side_effect=[
+            TelegramBadRequest(method=MagicMock(), message="can't parse entities"),
+            None,
+            None,
+        ]
+    )
+
+    with patch.object(
+        private_handlers,
+        "split_html_message",
+        return_value=["<b>one</b>", "<b>two &amp;</b>", "<i>three</i>"],
+    ):
+        await private_handlers._reply_in_chunks(message, "ignored")
+
+    message.reply.assert_awaited_once_with("<b>one</b>", parse_mode="HTML")
+    assert message.answer.await_args_list == [
+        call("<b>two &amp;</b>", parse_mode="HTML"),
+        call("two &"),
+        call("three"),
+    ]
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -252,6 +253,11 @@ class TestHandleSpamSkipAutoDelete:
     async def test_skip_auto_delete_no_deletion_no_ban(self, mock_message):
         """With skip_auto_delete=True, should not delete message or ban user."""
         with (
+            patch(
+                "src.app.handlers.handle_spam.get_admins_map",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
             patch(
                 "src.app.handlers.handle_spam.check_admin_delete_preferences",
                 new_callable=AsyncMock,
@@ -282,10 +288,60 @@ class TestHandleSpamSkipAutoDelete:
             mock_delete.assert_not_called()
             mock_ban.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_auto_delete_deletes_and_bans(self, mock_message):
+        """Without skip_auto_delete, the message is deleted, then its sender banned."""
+        with (
+            patch(
+                "src.app.handlers.handle_spam.get_admins_map",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
+            patch(
+                "src.app.handlers.handle_spam.check_admin_delete_preferences",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "src.app.handlers.handle_spam.notify_admins",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "src.app.handlers.handle_spam.handle_spam_message_deletion",
+                new_callable=AsyncMock,
+            ) as mock_delete,
+            patch(
+                "src.app.handlers.handle_spam.ban_user_for_spam",
+                new_callable=AsyncMock,
+            ) as mock_ban,
+        ):
+            calls = []
+
+            async def delete(*_args):
+                await asyncio.sleep(0)  # would let a concurrent ban overtake it
+                calls.append("delete")
+
+            mock_delete.side_effect = delete
+            mock_ban.side_effect = lambda *_args: calls.append("ban")
+
+            result = await handle_spam(mock_message, [123], reason="test")
+
+            assert result == "spam_auto_deleted"
+            mock_delete.assert_awaited_once_with(mock_message, [123])
+            mock_ban.assert_awaited_once()
+            # Deletion first: the ban revokes messages in supergroups
+            assert calls == ["delete", "ban"]
+
     @pytest.mark.asyncio
     async def test_skip_auto_delete_notify_with_both_buttons(self, mock_message):
         """With skip_auto_delete=True, notify_admins receives all_admins_delete=False."""
         with (
+            patch(
+                "src.app.handlers.handle_spam.get_admins_map",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
             patch(
                 "src.app.handlers.handle_spam.check_admin_delete_preferences",
                 new_callable=AsyncMock,
@@ -0,0 +1,63 @@
+"""Tests for group deactivation helpers in try_deduct_credits."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiogram.types import Chat, ChatMemberAdministrator, ChatMemberOwner, User
+
+from app.database.models import Administrator
+from app.handlers import try_deduct_credits as tdc
+
+
+def _owner(user_id: int, is_bot: bool = False) -> ChatMemberOwner:
+    return ChatMemberOwner(
+        user=User(id=user_id, is_bot=is_bot, first_name=f"u{user_id}"),
+        is_anonymous=False,
+    )
+
+
+def _admin(user_id: int) -> ChatMemberAdministrator:
+    return ChatMemberAdministrator.model_construct(
+        user=User(id=user_id, is_bot=False, first_name=f"u{user_id}"),
+    )
+
+
+def test_find_min_credits_admin_uses_preloaded_records():
+    admins = [_owner(1), _admin(2), _owner(3, is_bot=True)]
+    admins_map = {
+        1: Administrator(admin_id=1, credits=10),
+        2: Administrator(admin_id=2, credits=3),
+    }
+
+    admin, credits = tdc.find_min_credits_admin(admins, admins_map)
+
+    assert admin is admins[1]
+    assert credits == 3
+
+
+@pytest.mark.asyncio
+async def test_handle_deactivation_loads_admin_records_once():
+    admins = [_owner(1), _admin(2), _owner(3, is_bot=True)]
+    admins_map = {
+        1: Administrator(admin_id=1, credits=0, language_code="ru"),
+        2: Administrator(admin_id=2, credits=0, language_code="en"),
+    }
+    chat = Chat(id=-100, type="supergroup", title="Group", username=None)
+    with (
+        patch.object(tdc, "bot") as mock_bot,
+        patch.object(
+            tdc, "get_admins_map", AsyncMock(return_value=admins_map)
+        ) as mock_map,
+    ):
+        mock_bot.get_chat = AsyncMock(return_value=chat)
+        mock_bot.get_chat_administrators = AsyncMock(return_value=admins)
+        mock_bot.me = AsyncMock(
+            return_value=User(id=9, is_bot=True, first_name="b", username="bot")
+        )
+        mock_bot.send_message = AsyncMock()
+
+        await tdc.handle_deactivation(-100)
+
+    mock_map.assert_awaited_once_with([1, 2])
+    # One group message plus one DM per human admin
+    assert mock_bot.send_message.await_count == 3
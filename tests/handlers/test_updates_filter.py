@@ -0,0 +1,79 @@
+"""Tests for the group and private chat message filters."""
+
+from datetime import datetime, timezone
+
+import pytest
+from aiogram import types
+
+from app.handlers.updates_filter import (
+    filter_handle_edited_message,
+    filter_handle_message,
+    filter_private_forward,
+    filter_private_message,
+)
+
+
+def _message(chat_type: str = "private", text: str | None = "hi", **kwargs):
+    return types.Message(
+        message_id=1,
+        date=datetime.now(timezone.utc),
+        chat=types.Chat(id=1, type=chat_type),
+        text=text,
+        **kwargs,
+    )
+
+
+def _forward_origin() -> types.MessageOriginHiddenUser:
+    return types.MessageOriginHiddenUser(
+        date=datetime.now(timezone.utc), sender_user_name="someone"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        (_message(), True),
+        (_message(text=None), True),
+        (_message(text="/start"), False),
+        (_message(chat_type="supergroup"), False),
+        (_message(forward_origin=_forward_origin()), False),
+    ],
+)
+async def test_private_message_filter(message, expected):
+    assert await filter_private_message(message) is expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        (_message(forward_origin=_forward_origin()), True),
+        (_message(), False),
+        (_message(chat_type="group", forward_origin=_forward_origin()), False),
+    ],
+)
+async def test_private_forward_filter(message, expected):
+    assert await filter_private_forward(message) is expected
+
+
+_USER = types.User(id=5, is_bot=False, first_name="u")
+_PHOTO = types.PhotoSize(file_id="f", file_unique_id="u", width=1, height=1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        (_message(chat_type="supergroup"), True),
+        (_message(chat_type="group", text=None, photo=[_PHOTO]), True),
+        (_message(chat_type="private"), False),
+        (_message(chat_type="supergroup", text=None), False),
+        (_message(chat_type="supergroup", text=None, photo=[]), False),
+        (_message(chat_type="supergroup", new_chat_members=[_USER]), False),
+        (_message(chat_type="group", left_chat_member=_USER), False),
+    ],
+)
+async def test_group_message_filters(message, expected):
+    assert await filter_handle_message(message) is expected
+    assert await filter_handle_edited_message(message) is expected
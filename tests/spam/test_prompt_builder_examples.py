@@ -0,0 +1,49 @@
+"""Tests for reuse of rendered few-shot examples across prompts."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.spam import prompt_builder
+
+
+@pytest.fixture(autouse=True)
+def clear_examples_json_cache():
+    prompt_builder._examples_json_cache.clear()
+    yield
+    prompt_builder._examples_json_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_examples_rendered_once_per_cached_list():
+    examples = [{"text": "buy crypto", "score": 90}, {"text": "hello", "score": -80}]
+
+    with (
+        patch.object(
+            prompt_builder, "get_spam_examples", AsyncMock(return_value=examples)
+        ),
+        patch.object(
+            prompt_builder,
+            "format_spam_example_input",
+            wraps=prompt_builder.format_spam_example_input,
+        ) as format_input,
+    ):
+        first = (await prompt_builder.SpamPromptBuilder().add_spam_examples()).build()
+        second = (await prompt_builder.SpamPromptBuilder().add_spam_examples()).build()
+
+    assert first == second
+    assert format_input.call_count == len(examples)
+    labels = [item["label"] for item in json.loads(first)["examples"]]
+    assert labels == [
+        {"is_spam": True, "confidence": 90},
+        {"is_spam": False, "confidence": 80},
+    ]
+
+
+def test_distinct_lists_are_rendered_separately():
+    first = [{"text": "a", "score": 10}]
+    second = [{"text": "b", "score": 10}]
+
+    assert '"a"' in prompt_builder._render_examples_json(first)
+    assert '"b"' in prompt_builder._render_examples_json(second)
@@ -0,0 +1,112 @@
+"""Tests for reuse of LLM verdicts on identical classification requests."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.spam import spam_classifier
+
+
+@pytest.fixture(autouse=True)
+def clear_classification_cache():
+    spam_classifier._classification_cache.clear()
+    yield
+    spam_classifier._classification_cache.clear()
+
+
+def _gateway_agent(is_spam: bool, confidence: int, reason: str) -> MagicMock:
+    agent = MagicMock()
+    agent.run = AsyncMock(
+        return_value=SimpleNamespace(
+            output=SimpleNamespace(
+                is_spam=is_spam, confidence=confidence, reason=reason
+            )
+        )
+    )
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_identical_request_is_served_from_cache():
+    agent = _gateway_agent(True, 95, "crypto promo")
+    with (
+        patch.object(
+            spam_classifier, "build_system_prompt", AsyncMock(return_value="prompt")
+        ),
+        patch.object(spam_classifier, "get_gateway_spam_agent", return_value=agent),
+        patch.object(spam_classifier, "get_llm_route_timeout", return_value=30),
+    ):
+        first = await spam_classifier.is_spam("Earn $500 a day")
+        second = await spam_classifier.is_spam("Earn $500 a day")
+
+    assert first == second == (True, 95, "crypto promo")
+    agent.run.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_llm_call():
+    release = asyncio.Event()
+    verdict = SimpleNamespace(
+        output=SimpleNamespace(is_spam=True, confidence=90, reason="promo")
+    )
+
+    async def slow_run(*_args, **_kwargs):
+        await release.wait()
+        return verdict
+
+    agent = MagicMock()
+    agent.run = AsyncMock(side_effect=slow_run)
+    with (
+        patch.object(
+            spam_classifier, "build_system_prompt", AsyncMock(return_value="prompt")
+        ),
+        patch.object(spam_classifier, "get_gateway_spam_agent", return_value=agent),
+        patch.object(spam_classifier, "get_llm_route_timeout", return_value=30),
+    ):
+        calls = [
+            asyncio.create_task(spam_classifier.is_spam("Join my channel"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+    assert results == [(True, 90, "promo")] * 3
+    agent.run.assert_awaited_once()
+    assert not spam_classifier._inflight_classifications
+
+
+@pytest.mark.asyncio
+async def test_prompt_change_bypasses_cache():
+    agent = _gateway_agent(False, 80, "greeting")
+    prompts = AsyncMock(side_effect=["prompt v1", "prompt v2"])
+    with (
+        patch.object(spam_classifier, "build_system_prompt", prompts),
+        patch.object(spam_classifier, "get_gateway_spam_agent", return_value=agent),
+        patch.object(spam_classifier, "get_llm_route_timeout", return_value=30),
+    ):
+        await spam_classifier.is_spam("hello")
+        await spam_classifier.is_spam("hello")
+
+    assert agent.run.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_emoji_only_message_still_goes_to_llm():
+    """No shortcut for "harmless" reactions: they are a trust-building pattern."""
+    agent = _gateway_agent(True, 90, "trust building")
+    with (
+        patch.object(
+            spam_classifier, "build_system_prompt", AsyncMock(return_value="prompt")
+        ),
+        patch.object(spam_classifier, "get_gateway_spam_agent", return_value=agent),
+        patch.object(spam_classifier, "get_llm_route_timeout", return_value=30),
+    ):
+        result = await spam_classifier.is_spam(
+            "👍", context=spam_classifier.SpamClassificationContext(name="Anna")
+        )
+
+    assert result == (True, 90, "trust building")
+    agent.run.assert_awaited_once()
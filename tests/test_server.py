@@ -1,3 +1,7 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
 from src.app.main import extract_update_type_ignored
 
 
@@ -61,3 +65,17 @@ class TestExtractUpdateTypeIgnored:
 
         result = extract_update_type_ignored(json_update)
         assert result == "multiple_types_ignored"
+
+
+@pytest.mark.asyncio
+async def test_warm_caches_survives_db_outage():
+    """A failed pool warm-up is logged; startup continues and the prompt is warmed."""
+    from src.app import main
+
+    with (
+        patch.object(main, "warm_private_chat_prompt") as warm_prompt,
+        patch.object(main, "get_pool", AsyncMock(side_effect=OSError("db down"))),
+    ):
+        await main._on_startup_warm_caches(MagicMock())
+
+    warm_prompt.assert_called_once()